@@ -14,7 +14,7 @@ import json
 import datetime
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 import weasyprint
 import markdown2
 import jinja2
@@ -344,93 +344,111 @@ class PDFUAReporter:
             logger.error(f"Error al generar informe PDF: {e}")
             return False
     
-    def generate_text_report(self, output_path: Optional[str] = None) -> str:
+    def _iter_text_report_lines(self):
         """
-        Genera un informe en formato texto plano.
+        Genera una a una las líneas del informe en texto plano.
         
-        Args:
-            output_path: Ruta opcional donde guardar el texto generado
-            
         Returns:
-            str: Contenido de texto del informe
+            Iterator[str]: Líneas del informe, sin salto de línea final
         """
         # Asegurar que tenemos un resumen
         if not self.summary:
             self.generate_summary()
         
-        lines = []
-        
         # Encabezado
-        lines.append("=" * 80)
-        lines.append(f"INFORME DE CONFORMIDAD PDF/UA")
-        lines.append("=" * 80)
-        lines.append("")
+        yield "=" * 80
+        yield f"INFORME DE CONFORMIDAD PDF/UA"
+        yield "=" * 80
+        yield ""
         
         # Información del documento
-        lines.append("INFORMACIÓN DEL DOCUMENTO")
-        lines.append("-" * 30)
-        lines.append(f"Archivo: {self.document_info.get('filename', 'Desconocido')}")
-        lines.append(f"Ruta: {self.document_info.get('path', 'Desconocida')}")
-        lines.append(f"Páginas: {self.document_info.get('pages', 0)}")
-        lines.append(f"Fecha análisis: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        lines.append("")
+        yield "INFORMACIÓN DEL DOCUMENTO"
+        yield "-" * 30
+        yield f"Archivo: {self.document_info.get('filename', 'Desconocido')}"
+        yield f"Ruta: {self.document_info.get('path', 'Desconocida')}"
+        yield f"Páginas: {self.document_info.get('pages', 0)}"
+        yield f"Fecha análisis: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        yield ""
         
         # Resumen de conformidad
         conformance = self.summary.get("conformance", {})
-        lines.append("RESULTADO DE CONFORMIDAD")
-        lines.append("-" * 30)
-        lines.append(f"Nivel: {conformance.get('level', 'Desconocido')}")
-        lines.append(f"Nivel de madurez: {conformance.get('maturity_level', 0)}%")
-        lines.append(f"Problemas bloqueantes: {conformance.get('blocking_count', 0)}")
-        lines.append("")
+        yield "RESULTADO DE CONFORMIDAD"
+        yield "-" * 30
+        yield f"Nivel: {conformance.get('level', 'Desconocido')}"
+        yield f"Nivel de madurez: {conformance.get('maturity_level', 0)}%"
+        yield f"Problemas bloqueantes: {conformance.get('blocking_count', 0)}"
+        yield ""
         
         # Estadísticas
-        lines.append("ESTADÍSTICAS")
-        lines.append("-" * 30)
-        lines.append(f"Total problemas: {self.summary.get('total_issues', 0)}")
-        lines.append(f"Errores: {self.summary.get('error_count', 0)}")
-        lines.append(f"Advertencias: {self.summary.get('warning_count', 0)}")
-        lines.append(f"Informativo: {self.summary.get('info_count', 0)}")
-        lines.append(f"Corregibles automáticamente: {self.summary.get('fixable_count', 0)} ({self.summary.get('conformance', {}).get('fixable_percentage', 0)}%)")
-        lines.append("")
+        yield "ESTADÍSTICAS"
+        yield "-" * 30
+        yield f"Total problemas: {self.summary.get('total_issues', 0)}"
+        yield f"Errores: {self.summary.get('error_count', 0)}"
+        yield f"Advertencias: {self.summary.get('warning_count', 0)}"
+        yield f"Informativo: {self.summary.get('info_count', 0)}"
+        yield f"Corregibles automáticamente: {self.summary.get('fixable_count', 0)} ({self.summary.get('conformance', {}).get('fixable_percentage', 0)}%)"
+        yield ""
         
         # Recomendaciones
-        lines.append("RECOMENDACIONES PRINCIPALES")
-        lines.append("-" * 30)
+        yield "RECOMENDACIONES PRINCIPALES"
+        yield "-" * 30
         for rec in self.summary.get("recommendations", []):
-            lines.append(f"- {rec}")
-        lines.append("")
+            yield f"- {rec}"
+        yield ""
         
         # Problemas por categoría
-        lines.append("PROBLEMAS POR CATEGORÍA")
-        lines.append("-" * 30)
+        yield "PROBLEMAS POR CATEGORÍA"
+        yield "-" * 30
         categories = self.summary.get("categories", {})
         for cat_id, cat_data in sorted(categories.items()):
             if cat_data["total_count"] == 0:
                 continue
                 
-            lines.append(f"{cat_id}: {cat_data['name']} - {cat_data['total_count']} problemas")
-            lines.append(f"  Errores: {cat_data['error_count']}, Advertencias: {cat_data['warning_count']}, Info: {cat_data['info_count']}")
+            yield f"{cat_id}: {cat_data['name']} - {cat_data['total_count']} problemas"
+            yield f"  Errores: {cat_data['error_count']}, Advertencias: {cat_data['warning_count']}, Info: {cat_data['info_count']}"
             
             # Checkpoints dentro de esta categoría
             for checkpoint, cp_data in cat_data.get("checkpoints", {}).items():
                 if cp_data["total_count"] == 0:
                     continue
                     
-                lines.append(f"  {checkpoint} - {cp_data['total_count']} problemas")
+                yield f"  {checkpoint} - {cp_data['total_count']} problemas"
                 
                 # Mostrar algunos ejemplos de problemas
                 for i, issue in enumerate(cp_data.get("issues", [])[:3]):  # Mostrar máximo 3 ejemplos
                     desc = issue.get("description", "Sin descripción")
                     page = issue.get("page", "?")
                     page_info = f"página {page}" if page != "all" else "todo el documento"
-                    lines.append(f"    - {desc} ({page_info})")
+                    yield f"    - {desc} ({page_info})"
                 
                 if len(cp_data.get("issues", [])) > 3:
-                    lines.append(f"    - ... y {len(cp_data.get('issues', [])) - 3} problemas más")
+                    yield f"    - ... y {len(cp_data.get('issues', [])) - 3} problemas más"
+    
+    def generate_text_report_stream(self, write: Callable[[str], Any]) -> None:
+        """
+        Escribe el informe en texto plano línea a línea sin construirlo
+        completo en memoria.
+        
+        Args:
+            write: Función que recibe cada fragmento de texto (p. ej. f.write)
+        """
+        for i, line in enumerate(self._iter_text_report_lines()):
+            if i:
+                write("\n")
+            write(line)
+    
+    def generate_text_report(self, output_path: Optional[str] = None) -> str:
+        """
+        Genera un informe en formato texto plano.
         
+        Args:
+            output_path: Ruta opcional donde guardar el texto generado
+            
+        Returns:
+            str: Contenido de texto del informe
+        """
         # Unir todo en un texto
-        text_report = "\n".join(lines)
+        text_report = "\n".join(self._iter_text_report_lines())
         
         # Guardar en archivo si se especificó una ruta
         if output_path:
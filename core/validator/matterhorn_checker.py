@@ -15,8 +15,137 @@ import os
 from pathlib import Path
 from collections import defaultdict
 import re
+from types import MappingProxyType
 from loguru import logger
 
+# Títulos y descripciones de los 31 grupos de checkpoints de Matterhorn
+_CHECKPOINT_GROUPS = MappingProxyType({
+    "01": {
+        "title": "Etiquetado de contenido real",
+        "description": "Etiquetado adecuado de contenido real frente a artefactos"
+    },
+    "02": {
+        "title": "Mapeo de roles",
+        "description": "Mapeo apropiado de tipos de etiquetas personalizadas a tipos estándar"
+    },
+    "03": {
+        "title": "Parpadeo",
+        "description": "Contenido que parpadea y puede causar problemas de accesibilidad"
+    },
+    "04": {
+        "title": "Color y contraste",
+        "description": "Uso adecuado del color y contraste para transmitir información"
+    },
+    "05": {
+        "title": "Sonido",
+        "description": "Accesibilidad del contenido de audio"
+    },
+    "06": {
+        "title": "Metadatos",
+        "description": "Presencia y calidad de metadatos requeridos"
+    },
+    "07": {
+        "title": "Diccionario",
+        "description": "Configuración correcta del diccionario de preferencias del visor"
+    },
+    "08": {
+        "title": "Validación OCR",
+        "description": "Calidad del texto generado por OCR"
+    },
+    "09": {
+        "title": "Etiquetas apropiadas",
+        "description": "Uso adecuado de etiquetas estructurales"
+    },
+    "10": {
+        "title": "Mapeo de caracteres",
+        "description": "Mapeo de caracteres a Unicode"
+    },
+    "11": {
+        "title": "Idioma natural declarado",
+        "description": "Declaración adecuada del idioma natural del contenido"
+    },
+    "12": {
+        "title": "Caracteres extensibles",
+        "description": "Representación de caracteres estirados"
+    },
+    "13": {
+        "title": "Gráficos",
+        "description": "Etiquetado y descripción de gráficos"
+    },
+    "14": {
+        "title": "Encabezados",
+        "description": "Estructura y uso de encabezados"
+    },
+    "15": {
+        "title": "Tablas",
+        "description": "Estructura y accesibilidad de tablas"
+    },
+    "16": {
+        "title": "Listas",
+        "description": "Estructura y marcado de listas"
+    },
+    "17": {
+        "title": "Expresiones matemáticas",
+        "description": "Etiquetado y descripción de fórmulas matemáticas"
+    },
+    "18": {
+        "title": "Encabezados y pies de página",
+        "description": "Marcado de encabezados y pies de página como artefactos"
+    },
+    "19": {
+        "title": "Notas y referencias",
+        "description": "Etiquetado de notas al pie, notas finales y referencias"
+    },
+    "20": {
+        "title": "Contenido opcional",
+        "description": "Configuración del contenido opcional"
+    },
+    "21": {
+        "title": "Archivos embebidos",
+        "description": "Inclusión correcta de archivos embebidos"
+    },
+    "22": {
+        "title": "Hilos de artículo",
+        "description": "Orden lógico de los hilos de artículo"
+    },
+    "23": {
+        "title": "Firmas digitales",
+        "description": "Uso correcto de firmas digitales"
+    },
+    "24": {
+        "title": "Formularios no interactivos",
+        "description": "Etiquetado de formularios no interactivos"
+    },
+    "25": {
+        "title": "XFA",
+        "description": "Uso de XFA (XML Forms Architecture)"
+    },
+    "26": {
+        "title": "Seguridad",
+        "description": "Configuración de seguridad que no impide la accesibilidad"
+    },
+    "27": {
+        "title": "Navegación",
+        "description": "Elementos de navegación accesibles"
+    },
+    "28": {
+        "title": "Anotaciones",
+        "description": "Accesibilidad de las anotaciones"
+    },
+    "29": {
+        "title": "Acciones",
+        "description": "Accesibilidad de las acciones"
+    },
+    "30": {
+        "title": "XObjects",
+        "description": "Uso adecuado de XObjects"
+    },
+    "31": {
+        "title": "Fuentes",
+        "description": "Incrustación y configuración de fuentes"
+    }
+})
+
 class MatterhornChecker:
     """
     Clase para mapear problemas detectados con checkpoints de Matterhorn Protocol.
@@ -677,163 +806,14 @@ class MatterhornChecker:
         Returns:
             Dict: Grupos de checkpoints con títulos y descripciones
         """
-        # Definiciones de grupos
+        # Copia por instancia de las definiciones de grupos
         groups = {
-            "01": {
-                "title": "Etiquetado de contenido real",
-                "description": "Etiquetado adecuado de contenido real frente a artefactos",
-                "checkpoints": {}
-            },
-            "02": {
-                "title": "Mapeo de roles",
-                "description": "Mapeo apropiado de tipos de etiquetas personalizadas a tipos estándar",
-                "checkpoints": {}
-            },
-            "03": {
-                "title": "Parpadeo",
-                "description": "Contenido que parpadea y puede causar problemas de accesibilidad",
-                "checkpoints": {}
-            },
-            "04": {
-                "title": "Color y contraste",
-                "description": "Uso adecuado del color y contraste para transmitir información",
-                "checkpoints": {}
-            },
-            "05": {
-                "title": "Sonido",
-                "description": "Accesibilidad del contenido de audio",
-                "checkpoints": {}
-            },
-            "06": {
-                "title": "Metadatos",
-                "description": "Presencia y calidad de metadatos requeridos",
-                "checkpoints": {}
-            },
-            "07": {
-                "title": "Diccionario",
-                "description": "Configuración correcta del diccionario de preferencias del visor",
-                "checkpoints": {}
-            },
-            "08": {
-                "title": "Validación OCR",
-                "description": "Calidad del texto generado por OCR",
-                "checkpoints": {}
-            },
-            "09": {
-                "title": "Etiquetas apropiadas",
-                "description": "Uso adecuado de etiquetas estructurales",
-                "checkpoints": {}
-            },
-            "10": {
-                "title": "Mapeo de caracteres",
-                "description": "Mapeo de caracteres a Unicode",
-                "checkpoints": {}
-            },
-            "11": {
-                "title": "Idioma natural declarado",
-                "description": "Declaración adecuada del idioma natural del contenido",
-                "checkpoints": {}
-            },
-            "12": {
-                "title": "Caracteres extensibles",
-                "description": "Representación de caracteres estirados",
-                "checkpoints": {}
-            },
-            "13": {
-                "title": "Gráficos",
-                "description": "Etiquetado y descripción de gráficos",
-                "checkpoints": {}
-            },
-            "14": {
-                "title": "Encabezados",
-                "description": "Estructura y uso de encabezados",
-                "checkpoints": {}
-            },
-            "15": {
-                "title": "Tablas",
-                "description": "Estructura y accesibilidad de tablas",
-                "checkpoints": {}
-            },
-            "16": {
-                "title": "Listas",
-                "description": "Estructura y marcado de listas",
-                "checkpoints": {}
-            },
-            "17": {
-                "title": "Expresiones matemáticas",
-                "description": "Etiquetado y descripción de fórmulas matemáticas",
-                "checkpoints": {}
-            },
-            "18": {
-                "title": "Encabezados y pies de página",
-                "description": "Marcado de encabezados y pies de página como artefactos",
-                "checkpoints": {}
-            },
-            "19": {
-                "title": "Notas y referencias",
-                "description": "Etiquetado de notas al pie, notas finales y referencias",
-                "checkpoints": {}
-            },
-            "20": {
-                "title": "Contenido opcional",
-                "description": "Configuración del contenido opcional",
-                "checkpoints": {}
-            },
-            "21": {
-                "title": "Archivos embebidos",
-                "description": "Inclusión correcta de archivos embebidos",
-                "checkpoints": {}
-            },
-            "22": {
-                "title": "Hilos de artículo",
-                "description": "Orden lógico de los hilos de artículo",
-                "checkpoints": {}
-            },
-            "23": {
-                "title": "Firmas digitales",
-                "description": "Uso correcto de firmas digitales",
-                "checkpoints": {}
-            },
-            "24": {
-                "title": "Formularios no interactivos",
-                "description": "Etiquetado de formularios no interactivos",
-                "checkpoints": {}
-            },
-            "25": {
-                "title": "XFA",
-                "description": "Uso de XFA (XML Forms Architecture)",
-                "checkpoints": {}
-            },
-            "26": {
-                "title": "Seguridad",
-                "description": "Configuración de seguridad que no impide la accesibilidad",
-                "checkpoints": {}
-            },
-            "27": {
-                "title": "Navegación",
-                "description": "Elementos de navegación accesibles",
-                "checkpoints": {}
-            },
-            "28": {
-                "title": "Anotaciones",
-                "description": "Accesibilidad de las anotaciones",
-                "checkpoints": {}
-            },
-            "29": {
-                "title": "Acciones",
-                "description": "Accesibilidad de las acciones",
-                "checkpoints": {}
-            },
-            "30": {
-                "title": "XObjects",
-                "description": "Uso adecuado de XObjects",
-                "checkpoints": {}
-            },
-            "31": {
-                "title": "Fuentes",
-                "description": "Incrustación y configuración de fuentes",
+            group_id: {
+                "title": group["title"],
+                "description": group["description"],
                 "checkpoints": {}
             }
+            for group_id, group in _CHECKPOINT_GROUPS.items()
         }
         
         # Llenar los checkpoints para cada grupo
@@ -8,6 +8,35 @@ from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QTextOption
 from loguru import logger
 
+# Texto de ayuda sobre los atributos de etiquetas
+_HELP_HTML = """
+<h3>Atributos de Etiquetas PDF/UA</h3>
+
+<h4>Atributos Comunes:</h4>
+<ul>
+<li><b>Alt:</b> Texto alternativo para figuras y elementos gráficos (requerido para Figure)</li>
+<li><b>ActualText:</b> Texto real cuando el contenido visual no es legible</li>
+<li><b>E:</b> Texto de expansión para abreviaciones</li>
+<li><b>Lang:</b> Código de idioma (ej: es-ES, en-US)</li>
+<li><b>ID:</b> Identificador único del elemento</li>
+</ul>
+
+<h4>Atributos de Tabla:</h4>
+<ul>
+<li><b>Scope:</b> Alcance de celdas de cabecera (Row, Col, Both)</li>
+<li><b>Headers:</b> IDs de cabeceras relacionadas (para TD)</li>
+<li><b>ColSpan:</b> Número de columnas que abarca la celda</li>
+<li><b>RowSpan:</b> Número de filas que abarca la celda</li>
+</ul>
+
+<h4>Atributos de Lista:</h4>
+<ul>
+<li><b>ListNumbering:</b> Tipo de numeración (Decimal, UpperRoman, etc.)</li>
+</ul>
+
+<p><i>Para más información, consulte la documentación de PDF/UA y Tagged PDF.</i></p>
+"""
+
 class TagPropertiesEditor(QWidget):
     """
     Editor de propiedades de etiquetas PDF.
@@ -33,6 +62,9 @@ class TagPropertiesEditor(QWidget):
         
         self.pending_changes = {}
         
+        # Diálogo de ayuda, creado la primera vez que se solicita
+        self._help_dialog = None
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -595,36 +627,10 @@ class TagPropertiesEditor(QWidget):
     
     def _show_help(self):
         """Muestra ayuda sobre los atributos."""
-        help_text = """
-<h3>Atributos de Etiquetas PDF/UA</h3>
-
-<h4>Atributos Comunes:</h4>
-<ul>
-<li><b>Alt:</b> Texto alternativo para figuras y elementos gráficos (requerido para Figure)</li>
-<li><b>ActualText:</b> Texto real cuando el contenido visual no es legible</li>
-<li><b>E:</b> Texto de expansión para abreviaciones</li>
-<li><b>Lang:</b> Código de idioma (ej: es-ES, en-US)</li>
-<li><b>ID:</b> Identificador único del elemento</li>
-</ul>
-
-<h4>Atributos de Tabla:</h4>
-<ul>
-<li><b>Scope:</b> Alcance de celdas de cabecera (Row, Col, Both)</li>
-<li><b>Headers:</b> IDs de cabeceras relacionadas (para TD)</li>
-<li><b>ColSpan:</b> Número de columnas que abarca la celda</li>
-<li><b>RowSpan:</b> Número de filas que abarca la celda</li>
-</ul>
-
-<h4>Atributos de Lista:</h4>
-<ul>
-<li><b>ListNumbering:</b> Tipo de numeración (Decimal, UpperRoman, etc.)</li>
-</ul>
-
-<p><i>Para más información, consulte la documentación de PDF/UA y Tagged PDF.</i></p>
-        """
+        if self._help_dialog is None:
+            self._help_dialog = QMessageBox(self)
+            self._help_dialog.setWindowTitle("Ayuda - Atributos de Etiquetas")
+            self._help_dialog.setTextFormat(Qt.RichText)
+            self._help_dialog.setText(_HELP_HTML)
         
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Ayuda - Atributos de Etiquetas")
-        msg.setText(help_text)
-        msg.setTextFormat(Qt.RichText)
-        msg.exec_()
\ No newline at end of file
+        self._help_dialog.exec_()
\ No newline at end of file
@@ -51,7 +51,8 @@ from core.validator.matterhorn_checker import MatterhornChecker
 # Importar utilidades
 from utils.ui_utils import (setup_logger, set_application_style, create_splash_screen,
                            create_dark_light_palette, get_theme_color, show_error_message,
-                           show_info_message, show_warning_message, show_question_message)
+                           show_info_message, show_warning_message, show_question_message,
+                           show_matterhorn_help)
 
 class MainWindow(QMainWindow):
     """
@@ -436,6 +437,7 @@ class MainWindow(QMainWindow):
         self.problems_panel.problemSelected.connect(self._on_problem_selected)
         if hasattr(self.problems_panel, 'fixRequested'):
             self.problems_panel.fixRequested.connect(self._on_fix_requested)
+        self.problems_panel.helpRequested.connect(self._on_checkpoint_help_requested)
 
     def _on_open_file(self):
         """Manejador para abrir un archivo."""
@@ -1117,6 +1119,18 @@ class MainWindow(QMainWindow):
         # Implementar lógica de corrección específica
         pass
 
+    def _on_checkpoint_help_requested(self, checkpoint_id: str):
+        """
+        Manejador para solicitud de ayuda sobre un checkpoint.
+        
+        Args:
+            checkpoint_id: ID del checkpoint de Matterhorn
+        """
+        try:
+            show_matterhorn_help(self, checkpoint_id)
+        except Exception as e:
+            logger.error(f"Error al mostrar ayuda del checkpoint: {e}")
+
     def optimize_pdf(self):
         """Optimiza el PDF eliminando elementos innecesarios y reduciendo tamaño."""
         pass
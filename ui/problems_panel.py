@@ -3,13 +3,122 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, 
                               QTreeWidgetItem, QPushButton, QLineEdit, QLabel,
                               QComboBox, QHeaderView, QMenu, QMessageBox, QFrame,
-                              QCheckBox, QGroupBox, QSplitter, QTextEdit)
-from PySide6.QtCore import Qt, Signal, QTimer
+                              QCheckBox, QGroupBox, QSplitter, QApplication)
+from PySide6.QtCore import Qt, Signal, QTimer, QThread
 from PySide6.QtGui import QIcon, QFont, QColor, QAction
 from loguru import logger
 import qtawesome as qta
+import csv
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+# Retardos de la búsqueda diferida: corto si se escribe despacio, largo
+# durante ráfagas de pulsaciones, con un máximo de espera acumulada
+_SEARCH_DELAY_MS = 80
+_SEARCH_BURST_DELAY_MS = 250
+_SEARCH_BURST_INTERVAL = 0.15  # segundos entre pulsaciones para considerar ráfaga
+_SEARCH_MAX_WAIT = 0.6  # segundos máximos sin aplicar la búsqueda
+
+# Colores de las filas según severidad y para problemas revisados
+_SEVERITY_COLORS = {
+    "ERROR": QColor(255, 0, 0),      # Rojo
+    "WARNING": QColor(255, 165, 0),  # Naranja
+}
+_DEFAULT_SEVERITY_COLOR = QColor(0, 0, 255)  # Azul
+_REVIEWED_COLOR = QColor(128, 128, 128)  # Gris
+
+# Texto de los combos de filtro -> valor interno del filtro
+_SEVERITY_FILTER_MAP = {
+    "Todos": "all",
+    "Errores": "error",
+    "Advertencias": "warning",
+    "Información": "info"
+}
+_FIXABLE_FILTER_MAP = {
+    "Todos": "all",
+    "Sí": "yes",
+    "No": "no"
+}
+
+# Claves que el panel garantiza en cada problema y su valor por defecto
+_ISSUE_DEFAULTS = (
+    ("checkpoint", ""),
+    ("severity", ""),
+    ("description", ""),
+    ("fix_description", ""),
+    ("fixable", False),
+    ("reviewed", False),
+)
+
+def _write_issues_export(file_path: str, export_format: str, issues: List[Dict]):
+    """
+    Escribe los problemas en un archivo JSON, CSV o de texto plano.
+    
+    Args:
+        file_path: Ruta del archivo de destino
+        export_format: "json", "csv" o "txt"
+        issues: Problemas a exportar
+    """
+    if export_format == "json":
+        # json.dump codifica y escribe por fragmentos
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(issues, f, indent=2, ensure_ascii=False)
+            
+    elif export_format == "csv":
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            # Encabezados
+            writer.writerow(["Checkpoint", "Severidad", "Descripción", "Página", "Reparable", "Solución"])
+            
+            # Datos, generados fila a fila
+            writer.writerows(
+                (issue.get("checkpoint", ""),
+                 issue.get("severity", ""),
+                 issue.get("description", ""),
+                 issue.get("page", ""),
+                 "Sí" if issue.get("fixable", False) else "No",
+                 issue.get("fix_description", ""))
+                for issue in issues
+            )
+            
+    else:  # Texto plano
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write("INFORME DE PROBLEMAS DE ACCESIBILIDAD\n")
+            f.write("=" * 50 + "\n\n")
+            f.write(f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Total de problemas: {len(issues)}\n\n")
+            
+            for i, issue in enumerate(issues, 1):
+                f.write(f"{i}. {issue.get('checkpoint', 'N/A')} - {issue.get('severity', '').upper()}\n")
+                f.write(f"   Descripción: {issue.get('description', '')}\n")
+                f.write(f"   Página: {issue.get('page', 'N/A')}\n")
+                f.write(f"   Reparable: {'Sí' if issue.get('fixable', False) else 'No'}\n")
+                if issue.get('fix_description'):
+                    f.write(f"   Solución: {issue.get('fix_description', '')}\n")
+                f.write("\n")
+
+class ExportThread(QThread):
+    """Hilo para exportar los problemas sin bloquear la interfaz."""
+    exportFinished = Signal(bool, str)  # éxito, ruta o mensaje de error
+    
+    def __init__(self, file_path: str, export_format: str, issues: List[Dict]):
+        super().__init__()
+        self.file_path = file_path
+        self.export_format = export_format
+        self.issues = issues
+        
+    def run(self):
+        try:
+            _write_issues_export(self.file_path, self.export_format, self.issues)
+            self.exportFinished.emit(True, self.file_path)
+        except Exception as e:
+            logger.error(f"Error al exportar problemas: {e}")
+            self.exportFinished.emit(False, str(e))
+
 class ProblemsPanel(QWidget):
     """
     Panel para mostrar y gestionar problemas de accesibilidad detectados.
@@ -19,19 +128,47 @@ class ProblemsPanel(QWidget):
     problemSelected = Signal(dict)  # Emite el problema seleccionado
     fixRequested = Signal(dict)     # Emite solicitud de reparación
     navigateToPage = Signal(int)    # Emite solicitud de navegación a página
+    helpRequested = Signal(str)     # Emite solicitud de ayuda para un checkpoint
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.issues = []  # Lista de problemas
         self.filtered_issues = []  # Lista filtrada
+        self._filtered_groups = []  # [(checkpoint, problemas filtrados)] en orden
+        self._by_checkpoint = defaultdict(list)  # Índice checkpoint -> problemas
+        self._sorted_checkpoints = []  # Claves del índice ordenadas
+        self._checkpoint_items = []  # Checkpoints mostrados en el combo de filtro
+        self._item_by_issue_id = {}  # id(problema) -> elemento del árbol
+        self._group_items = {}  # checkpoint -> elemento de grupo del árbol
+        self._group_rows = {}  # checkpoint -> [(id(problema), elemento hijo)]
+        self._index_by_issue_id = {}  # id(problema) -> posición en self.issues
+        self._reviewed_ids = set()  # id() de los problemas marcados como revisados
+        self._lowered = {}  # id(problema) -> (severidad, descripción, solución) en minúsculas
+        self._stats = self._empty_stats()  # Contadores para la barra de estado
         self.current_issue = None
+        self._export_thread = None
+        
+        # El panel va empotrado en un dock y no recibe closeEvent al salir:
+        # esperar a la exportación en curso antes de que se destruya
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._wait_for_export_thread)
         
         # Filtros
         self.severity_filter = "all"
         self.checkpoint_filter = "all"
         self.fixable_filter = "all"
         self.search_text = ""
+        self._last_applied_search = ""
+        self._last_keystroke = 0.0
+        self._search_pending_since = None
+        
+        # Fuentes reutilizadas por todas las filas del árbol
+        self._group_font = QFont()
+        self._group_font.setBold(True)
+        self._reviewed_font = QFont()
+        self._reviewed_font.setStrikeOut(True)
         
         self._init_ui()
         self._setup_context_menu()
@@ -39,7 +176,18 @@ class ProblemsPanel(QWidget):
         # Timer para búsqueda diferida
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self._apply_filters)
+        self.search_timer.timeout.connect(self._on_search_timeout)
+        
+        # Timer para agrupar cambios rápidos en los filtros
+        self.filter_timer = QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(50)
+        self.filter_timer.timeout.connect(self._apply_filters)
+        
+        # Temporizador compartido para devolver la barra de estado a "Listo"
+        self._status_reset_timer = QTimer()
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(lambda: self.status_label.setText("Listo"))
     
     def _init_ui(self):
         """Inicializa la interfaz de usuario."""
@@ -143,6 +291,9 @@ class ProblemsPanel(QWidget):
         self.problems_tree = QTreeWidget()
         self.problems_tree.setHeaderLabels(["Severidad", "Checkpoint", "Descripción", "Página", "Reparable"])
         
+        # Todas las filas son de una línea: evita que la vista mida cada fila
+        self.problems_tree.setUniformRowHeights(True)
+        
         # Configurar columnas
         header = self.problems_tree.header()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Severidad
@@ -195,9 +346,11 @@ class ProblemsPanel(QWidget):
         desc_group = QGroupBox("Descripción")
         desc_layout = QVBoxLayout(desc_group)
         
-        self.description_text = QTextEdit()
-        self.description_text.setMaximumHeight(80)
-        self.description_text.setReadOnly(True)
+        self.description_text = QLabel()
+        self.description_text.setTextFormat(Qt.PlainText)
+        self.description_text.setWordWrap(True)
+        self.description_text.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.description_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
         desc_layout.addWidget(self.description_text)
         
         details_layout.addWidget(desc_group)
@@ -206,9 +359,11 @@ class ProblemsPanel(QWidget):
         fix_group = QGroupBox("Solución Sugerida")
         fix_layout = QVBoxLayout(fix_group)
         
-        self.fix_description_text = QTextEdit()
-        self.fix_description_text.setMaximumHeight(80)
-        self.fix_description_text.setReadOnly(True)
+        self.fix_description_text = QLabel()
+        self.fix_description_text.setTextFormat(Qt.PlainText)
+        self.fix_description_text.setWordWrap(True)
+        self.fix_description_text.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.fix_description_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
         fix_layout.addWidget(self.fix_description_text)
         
         details_layout.addWidget(fix_group)
@@ -277,6 +432,21 @@ class ProblemsPanel(QWidget):
         self.action_mark_reviewed = QAction("Marcar como revisado", self)
         self.action_mark_reviewed.triggered.connect(self._mark_as_reviewed)
         self.context_menu.addAction(self.action_mark_reviewed)
+        
+        self.context_menu.addSeparator()
+        
+        # Acción de ayuda del checkpoint
+        self.action_help = QAction(qta.icon("fa5s.question-circle"), "Ayuda del checkpoint", self)
+        self.action_help.triggered.connect(self._on_checkpoint_help)
+        self.context_menu.addAction(self.action_help)
+        
+        # Menú contextual para los grupos de checkpoint
+        self.group_context_menu = QMenu(self)
+        self.context_checkpoint = None
+        
+        self.action_mark_checkpoint_reviewed = QAction("Marcar checkpoint como revisado", self)
+        self.action_mark_checkpoint_reviewed.triggered.connect(self._mark_checkpoint_as_reviewed)
+        self.group_context_menu.addAction(self.action_mark_checkpoint_reviewed)
     
     def set_issues(self, issues: List[Dict]):
         """
@@ -285,7 +455,13 @@ class ProblemsPanel(QWidget):
         Args:
             issues: Lista de problemas detectados
         """
-        self.issues = issues.copy() if issues else []
+        self.issues = self._normalize_issues(issues or [])
+        
+        # Reconstruir índices por checkpoint y de revisados
+        self._rebuild_indexes()
+        
+        # Crear los elementos del árbol una sola vez
+        self._build_problems_tree()
         
         # Actualizar lista de checkpoints para el filtro
         self._update_checkpoint_filter()
@@ -302,136 +478,312 @@ class ProblemsPanel(QWidget):
         """Obtiene la lista actual de problemas."""
         return self.issues.copy()
     
+    @staticmethod
+    def _normalize_issues(issues: List[Dict]) -> List[Dict]:
+        """
+        Crea copias de los problemas con las claves usadas por el panel, para
+        poder acceder a ellas directamente sin modificar los originales.
+        
+        Args:
+            issues: Lista de problemas recibidos
+            
+        Returns:
+            List[Dict]: Copias superficiales de los problemas normalizadas
+        """
+        normalized = []
+        for issue in issues:
+            issue = dict(issue)
+            for key, default in _ISSUE_DEFAULTS:
+                issue.setdefault(key, default)
+            
+            # Los checkpoints y severidades se repiten mucho: compartir una
+            # sola cadena por valor abarata comparaciones y claves del índice
+            for key in ("checkpoint", "severity"):
+                value = issue[key]
+                if type(value) is str:
+                    issue[key] = sys.intern(value)
+            normalized.append(issue)
+        return normalized
+    
+    def _rebuild_indexes(self):
+        """Reconstruye los índices por checkpoint, de revisados y los contadores."""
+        self._by_checkpoint = defaultdict(list)
+        self._reviewed_ids = set()
+        self._index_by_issue_id = {}
+        self._lowered = {}
+        stats = self._empty_stats()
+        for index, issue in enumerate(self.issues):
+            self._index_by_issue_id[id(issue)] = index
+            self._lowered[id(issue)] = (sys.intern(issue["severity"].lower()),
+                                        issue["description"].lower(),
+                                        issue["fix_description"].lower())
+            self._by_checkpoint[issue["checkpoint"]].append(issue)
+            if issue["reviewed"]:
+                self._reviewed_ids.add(id(issue))
+                stats["reviewed"] += 1
+            
+            severity = issue["severity"]
+            if severity in ("error", "warning", "info"):
+                stats[severity] += 1
+            if issue["fixable"]:
+                stats["fixable"] += 1
+        self._stats = stats
+        self._sorted_checkpoints = sorted(self._by_checkpoint)
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        """Devuelve los contadores de estadísticas a cero."""
+        return {"error": 0, "warning": 0, "info": 0, "fixable": 0, "reviewed": 0}
+    
     def _update_checkpoint_filter(self):
         """Actualiza la lista de checkpoints en el filtro."""
-        checkpoints = set()
-        for issue in self.issues:
-            checkpoint = issue.get("checkpoint", "")
-            if checkpoint:
-                checkpoints.add(checkpoint)
+        checkpoints = [checkpoint for checkpoint in self._sorted_checkpoints if checkpoint]
+        if checkpoints == self._checkpoint_items:
+            return
+        self._checkpoint_items = checkpoints
         
-        # Limpiar y rellenar combo
+        # Limpiar y rellenar combo sin disparar un filtrado por cada elemento
         current_text = self.checkpoint_combo.currentText()
-        self.checkpoint_combo.clear()
-        self.checkpoint_combo.addItem("Todos")
-        
-        for checkpoint in sorted(checkpoints):
-            self.checkpoint_combo.addItem(checkpoint)
+        self.checkpoint_combo.blockSignals(True)
+        try:
+            self.checkpoint_combo.clear()
+            self.checkpoint_combo.addItems(["Todos"] + checkpoints)
+            
+            # Restaurar selección si es posible
+            index = self.checkpoint_combo.findText(current_text)
+            self.checkpoint_combo.setCurrentIndex(max(index, 0))
+        finally:
+            self.checkpoint_combo.blockSignals(False)
         
-        # Restaurar selección si es posible
-        index = self.checkpoint_combo.findText(current_text)
-        if index >= 0:
-            self.checkpoint_combo.setCurrentIndex(index)
+        self.checkpoint_filter = "all" if index <= 0 else current_text
     
     def _apply_filters(self):
         """Aplica los filtros actuales a la lista de problemas."""
+        # Una aplicación directa cancela las diferidas pendientes
+        self.filter_timer.stop()
+        self.search_timer.stop()
+        self._search_pending_since = None
+        self._last_applied_search = self.search_text
+        
         self.filtered_issues = []
+        self._filtered_groups = []
         
-        for issue in self.issues:
-            # Filtro por severidad
-            if self.severity_filter != "all":
-                issue_severity = issue.get("severity", "").lower()
-                if self.severity_filter == "error" and issue_severity != "error":
-                    continue
-                elif self.severity_filter == "warning" and issue_severity != "warning":
-                    continue
-                elif self.severity_filter == "info" and issue_severity != "info":
-                    continue
-            
-            # Filtro por checkpoint
-            if self.checkpoint_filter != "all":
-                issue_checkpoint = issue.get("checkpoint", "")
-                if issue_checkpoint != self.checkpoint_filter:
-                    continue
-            
-            # Filtro por reparable
-            if self.fixable_filter != "all":
-                is_fixable = issue.get("fixable", False)
-                if self.fixable_filter == "yes" and not is_fixable:
-                    continue
-                elif self.fixable_filter == "no" and is_fixable:
-                    continue
-            
-            # Filtro de búsqueda
-            if self.search_text:
-                description = issue.get("description", "").lower()
-                fix_description = issue.get("fix_description", "").lower()
-                if (self.search_text.lower() not in description and 
-                    self.search_text.lower() not in fix_description):
-                    continue
+        # Recorrer los grupos ya ordenados del índice; con filtro de
+        # checkpoint basta con su propio grupo
+        if self.checkpoint_filter != "all":
+            checkpoints = (self.checkpoint_filter,)
+        else:
+            checkpoints = self._sorted_checkpoints
+        
+        predicate = self._build_filter_predicate()
+        
+        for checkpoint in checkpoints:
+            bucket = self._by_checkpoint.get(checkpoint, ())
+            if predicate is None:
+                matched = list(bucket)
+            else:
+                matched = [issue for issue in bucket if predicate(issue)]
             
-            self.filtered_issues.append(issue)
+            if matched:
+                self._filtered_groups.append((checkpoint, matched))
+                self.filtered_issues.extend(matched)
         
         # Actualizar vista
         self._update_problems_tree()
         self._update_count_label()
     
-    def _update_problems_tree(self):
-        """Actualiza el árbol de problemas con los problemas filtrados."""
-        self.problems_tree.clear()
-        
-        # Agrupar por checkpoint
-        grouped_issues = {}
-        for issue in self.filtered_issues:
-            checkpoint = issue.get("checkpoint", "Unknown")
-            if checkpoint not in grouped_issues:
-                grouped_issues[checkpoint] = []
-            grouped_issues[checkpoint].append(issue)
-        
-        # Crear elementos del árbol
-        for checkpoint in sorted(grouped_issues.keys()):
-            issues_in_checkpoint = grouped_issues[checkpoint]
-            
+    def _build_filter_predicate(self):
+        """
+        Construye la función de filtrado capturando una sola vez el estado
+        actual de los filtros. Solo se incluyen las comprobaciones de los
+        filtros activos.
+        
+        Returns:
+            Función que recibe un problema y devuelve True si pasa los filtros,
+            o None si no hay ningún filtro activo
+        """
+        checks = []
+        # Textos en minúsculas precalculados al cargar los problemas
+        lowered = self._lowered
+        
+        # Filtro por severidad
+        if self.severity_filter != "all":
+            severity_filter = self.severity_filter
+            checks.append(lambda issue: lowered[id(issue)][0] == severity_filter)
+        
+        # Filtro por reparable
+        if self.fixable_filter != "all":
+            wanted_fixable = self.fixable_filter == "yes"
+            checks.append(lambda issue: bool(issue["fixable"]) == wanted_fixable)
+        
+        # Filtro de búsqueda
+        search_text = self.search_text.lower()
+        terms = search_text.split()
+        if len(terms) > 1:
+            # Varias palabras: todas deben aparecer en el mismo campo
+            def matches_search(issue):
+                _, description, fix_description = lowered[id(issue)]
+                return (all(term in description for term in terms) or
+                        all(term in fix_description for term in terms))
+            checks.append(matches_search)
+        elif search_text:
+            def matches_search(issue):
+                _, description, fix_description = lowered[id(issue)]
+                return search_text in description or search_text in fix_description
+            checks.append(matches_search)
+        
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        
+        checks = tuple(checks)
+        return lambda issue: all(check(issue) for check in checks)
+    
+    def _build_problems_tree(self):
+        """
+        Crea una sola vez los elementos del árbol para todos los problemas.
+        Los filtros posteriores solo muestran u ocultan filas.
+        """
+        self._item_by_issue_id = {}
+        self._group_items = {}
+        self._group_rows = {}
+        
+        # Construir los elementos desacoplados del árbol e insertarlos de una vez
+        group_items = []
+        for checkpoint in self._sorted_checkpoints:
             # Crear elemento padre para el checkpoint
-            checkpoint_item = QTreeWidgetItem(self.problems_tree)
+            checkpoint_item = QTreeWidgetItem()
             checkpoint_item.setText(0, "")  # Severidad (vacía para grupo)
-            checkpoint_item.setText(1, checkpoint)
-            checkpoint_item.setText(2, f"{len(issues_in_checkpoint)} problemas")
+            checkpoint_item.setText(1, checkpoint or "Unknown")
+            checkpoint_item.setData(1, Qt.UserRole, checkpoint)
             checkpoint_item.setText(3, "")  # Página (vacía para grupo)
             checkpoint_item.setText(4, "")  # Reparable (vacía para grupo)
             
             # Estilo para el grupo
-            font = QFont()
-            font.setBold(True)
-            checkpoint_item.setFont(1, font)
-            checkpoint_item.setFont(2, font)
+            checkpoint_item.setFont(1, self._group_font)
+            checkpoint_item.setFont(2, self._group_font)
+            
+            self._group_items[checkpoint] = checkpoint_item
+            group_items.append(checkpoint_item)
             
             # Crear elementos hijos para cada problema
-            for issue in issues_in_checkpoint:
-                issue_item = QTreeWidgetItem(checkpoint_item)
-                
-                # Configurar columnas
-                severity = issue.get("severity", "").upper()
-                issue_item.setText(0, severity)
-                issue_item.setText(1, "")  # Checkpoint vacío para hijos
-                issue_item.setText(2, issue.get("description", ""))
-                
-                page = issue.get("page", "")
-                if isinstance(page, int):
-                    issue_item.setText(3, str(page + 1))  # Convertir a base 1
-                elif page == "all":
-                    issue_item.setText(3, "Todas")
-                else:
-                    issue_item.setText(3, str(page))
-                
-                issue_item.setText(4, "Sí" if issue.get("fixable", False) else "No")
-                
-                # Configurar colores según severidad
-                if severity == "ERROR":
-                    color = QColor(255, 0, 0)  # Rojo
-                elif severity == "WARNING":
-                    color = QColor(255, 165, 0)  # Naranja
-                else:
-                    color = QColor(0, 0, 255)  # Azul
+            issue_items = []
+            rows = []
+            for issue in self._by_checkpoint[checkpoint]:
+                issue_item = QTreeWidgetItem()
+                self._fill_issue_item(issue_item, issue)
+                self._item_by_issue_id[id(issue)] = issue_item
+                issue_items.append(issue_item)
+                rows.append((id(issue), issue_item))
+            checkpoint_item.addChildren(issue_items)
+            self._group_rows[checkpoint] = rows
+        
+        self.problems_tree.setUpdatesEnabled(False)
+        self.problems_tree.blockSignals(True)
+        try:
+            self.problems_tree.clear()
+            self.problems_tree.insertTopLevelItems(0, group_items)
+        finally:
+            self.problems_tree.blockSignals(False)
+            self.problems_tree.setUpdatesEnabled(True)
+        
+        # La selección anterior se perdió con clear()
+        self.current_issue = None
+        self._update_details_panel(None)
+    
+    def _update_problems_tree(self):
+        """Muestra en el árbol solo los problemas filtrados, ocultando el resto."""
+        visible_groups = dict(self._filtered_groups)
+        visible_ids = set(map(id, self.filtered_issues))
+        group_rows = self._group_rows
+        
+        self.problems_tree.setUpdatesEnabled(False)
+        self.problems_tree.blockSignals(True)
+        try:
+            for checkpoint, checkpoint_item in self._group_items.items():
+                issues_in_checkpoint = visible_groups.get(checkpoint)
+                if not issues_in_checkpoint:
+                    checkpoint_item.setHidden(True)
+                    continue
                 
-                issue_item.setForeground(0, color)
+                checkpoint_item.setHidden(False)
+                checkpoint_item.setText(2, f"{len(issues_in_checkpoint)} problemas")
+                # Filas precalculadas al construir el árbol
+                for issue_id, issue_item in group_rows[checkpoint]:
+                    issue_item.setHidden(issue_id not in visible_ids)
                 
-                # Almacenar referencia al problema
-                issue_item.setData(0, Qt.UserRole, issue)
+                # Expandir el grupo solo si tiene pocos elementos
+                checkpoint_item.setExpanded(len(issues_in_checkpoint) <= 5)
+        finally:
+            self.problems_tree.blockSignals(False)
+            self.problems_tree.setUpdatesEnabled(True)
+        
+        # No mantener seleccionado un problema que ha quedado oculto
+        current_item = self.problems_tree.currentItem()
+        if current_item is not None and (current_item.isHidden() or
+                                         (current_item.parent() is not None and
+                                          current_item.parent().isHidden())):
+            self.problems_tree.setCurrentItem(None)
+    
+    def _fill_issue_item(self, issue_item: QTreeWidgetItem, issue: Dict):
+        """
+        Rellena las columnas de un elemento del árbol con los datos del problema.
+        
+        Args:
+            issue_item: Elemento del árbol a rellenar
+            issue: Problema asociado al elemento
+        """
+        # Configurar columnas
+        severity = issue["severity"].upper()
+        issue_item.setText(0, severity)
+        issue_item.setText(1, "")  # Checkpoint vacío para hijos
+        issue_item.setText(2, issue["description"])
+        
+        page = issue.get("page", "")
+        if isinstance(page, int):
+            issue_item.setText(3, str(page + 1))  # Convertir a base 1
+        elif page == "all":
+            issue_item.setText(3, "Todas")
+        else:
+            issue_item.setText(3, str(page))
+        
+        issue_item.setText(4, "Sí" if issue["fixable"] else "No")
+        
+        if id(issue) in self._reviewed_ids:
+            self._apply_reviewed_style(issue_item)
+        else:
+            # Configurar colores según severidad
+            issue_item.setForeground(0, _SEVERITY_COLORS.get(severity, _DEFAULT_SEVERITY_COLOR))
+        
+        # Almacenar la posición del problema en self.issues
+        issue_item.setData(0, Qt.UserRole, self._index_by_issue_id[id(issue)])
+    
+    def _apply_reviewed_style(self, issue_item: QTreeWidgetItem):
+        """
+        Aplica el estilo de problema revisado: tachado y en gris.
+        
+        Args:
+            issue_item: Elemento del árbol del problema
+        """
+        issue_item.setFont(2, self._reviewed_font)
+        for col in range(self.problems_tree.columnCount()):
+            issue_item.setForeground(col, _REVIEWED_COLOR)
+    
+    def _issue_from_item(self, item: QTreeWidgetItem) -> Optional[Dict]:
+        """
+        Obtiene el problema asociado a un elemento del árbol.
+        
+        Args:
+            item: Elemento del árbol
             
-            # Expandir el grupo si tiene pocos elementos
-            if len(issues_in_checkpoint) <= 5:
-                checkpoint_item.setExpanded(True)
+        Returns:
+            Problema asociado o None si el elemento es un grupo
+        """
+        index = item.data(0, Qt.UserRole)
+        if index is None:
+            return None
+        return self.issues[index]
     
     def _update_count_label(self):
         """Actualiza la etiqueta de conteo."""
@@ -449,27 +801,26 @@ class ProblemsPanel(QWidget):
             self.stats_label.setText("")
             return
         
-        # Contar por severidad
-        errors = len([i for i in self.issues if i.get("severity") == "error"])
-        warnings = len([i for i in self.issues if i.get("severity") == "warning"])
-        infos = len([i for i in self.issues if i.get("severity") == "info"])
-        fixable = len([i for i in self.issues if i.get("fixable", False)])
-        
-        stats_text = f"Errores: {errors} | Advertencias: {warnings} | Info: {infos} | Reparables: {fixable}"
+        # Los contadores se mantienen al cargar y al modificar problemas
+        stats = self._stats
+        stats_text = (f"Errores: {stats['error']} | Advertencias: {stats['warning']} | "
+                      f"Info: {stats['info']} | Reparables: {stats['fixable']}")
+        if stats["reviewed"]:
+            stats_text += f" | Revisados: {stats['reviewed']}"
         self.stats_label.setText(stats_text)
     
     def _on_problem_selected(self):
         """Maneja la selección de un problema."""
         current_item = self.problems_tree.currentItem()
-        if not current_item:
-            self.current_issue = None
-            self._update_details_panel(None)
+        
+        # Obtener el problema almacenado (None si es un grupo)
+        issue = self._issue_from_item(current_item) if current_item else None
+        
+        # El panel de detalles solo se rellena cuando cambia el problema
+        if issue is self.current_issue:
             return
         
-        # Obtener el problema almacenado
-        issue = current_item.data(0, Qt.UserRole)
         if not issue:
-            # Posiblemente es un grupo, no un problema individual
             self.current_issue = None
             self._update_details_panel(None)
             return
@@ -482,7 +833,7 @@ class ProblemsPanel(QWidget):
     
     def _on_problem_double_clicked(self, item, column):
         """Maneja el doble clic en un problema."""
-        issue = item.data(0, Qt.UserRole)
+        issue = self._issue_from_item(item)
         if issue:
             # Navegar a la página del problema
             self._navigate_to_problem(issue)
@@ -506,10 +857,10 @@ class ProblemsPanel(QWidget):
             return
         
         # Actualizar información básica
-        checkpoint = issue.get("checkpoint", "Desconocido")
+        checkpoint = issue["checkpoint"] or "Desconocido"
         self.checkpoint_label.setText(f"Checkpoint: {checkpoint}")
         
-        severity = issue.get("severity", "").title()
+        severity = issue["severity"].title()
         self.severity_label.setText(f"Severidad: {severity}")
         
         page = issue.get("page", "")
@@ -521,21 +872,21 @@ class ProblemsPanel(QWidget):
             page_text = str(page)
         self.page_label.setText(f"Página: {page_text}")
         
-        fixable = "Sí" if issue.get("fixable", False) else "No"
+        fixable = "Sí" if issue["fixable"] else "No"
         self.fixable_label.setText(f"Reparable: {fixable}")
         
         # Actualizar descripciones
-        description = issue.get("description", "Sin descripción")
+        description = issue["description"] or "Sin descripción"
         self.description_text.setText(description)
         
-        fix_description = issue.get("fix_description", "Sin información de reparación")
+        fix_description = issue["fix_description"] or "Sin información de reparación"
         self.fix_description_text.setText(fix_description)
         
         # Habilitar/deshabilitar botones
         can_navigate = (page != "all" and page is not None)
         self.navigate_btn.setEnabled(can_navigate)
         
-        can_fix = issue.get("fixable", False)
+        can_fix = issue["fixable"]
         self.fix_btn.setEnabled(can_fix)
     
     def _on_navigate_clicked(self):
@@ -570,86 +921,161 @@ class ProblemsPanel(QWidget):
         """Muestra el menú contextual."""
         item = self.problems_tree.itemAt(position)
         if item:
-            issue = item.data(0, Qt.UserRole)
+            issue = self._issue_from_item(item)
             if issue:
                 # Actualizar estado de las acciones
                 page = issue.get("page")
                 can_navigate = (page != "all" and page is not None)
                 self.action_navigate.setEnabled(can_navigate)
                 
-                can_fix = issue.get("fixable", False)
+                can_fix = issue["fixable"]
                 self.action_fix.setEnabled(can_fix)
                 
                 # Mostrar menú
                 self.context_menu.exec_(self.problems_tree.mapToGlobal(position))
+            else:
+                # Elemento de grupo: acciones sobre todo el checkpoint
+                self.context_checkpoint = item.data(1, Qt.UserRole)
+                self.group_context_menu.exec_(self.problems_tree.mapToGlobal(position))
     
     def _copy_description(self):
         """Copia la descripción del problema al portapapeles."""
         if self.current_issue:
             from PySide6.QtGui import QGuiApplication
             
-            description = self.current_issue.get("description", "")
+            description = self.current_issue["description"]
             clipboard = QGuiApplication.clipboard()
             clipboard.setText(description)
             
-            self.status_label.setText("Descripción copiada al portapapeles")
-            QTimer.singleShot(3000, lambda: self.status_label.setText("Listo"))
+            self._flash_status("Descripción copiada al portapapeles")
+    
+    def _flash_status(self, message: str, msecs: int = 3000):
+        """
+        Muestra un mensaje temporal en la barra de estado. Un mensaje nuevo
+        reinicia la cuenta del anterior.
+        
+        Args:
+            message: Texto a mostrar
+            msecs: Milisegundos hasta volver a "Listo"
+        """
+        self.status_label.setText(message)
+        self._status_reset_timer.start(msecs)
     
     def _mark_as_reviewed(self):
         """Marca el problema como revisado."""
+        if self.current_issue and self._set_reviewed((self.current_issue,)):
+            self.status_label.setText("Problema marcado como revisado")
+    
+    def _mark_checkpoint_as_reviewed(self):
+        """Marca como revisados todos los problemas del checkpoint seleccionado."""
+        count = self._set_reviewed(self._by_checkpoint.get(self.context_checkpoint, ()))
+        if count:
+            self.status_label.setText(
+                f"{count} problemas de {self.context_checkpoint} marcados como revisados")
+    
+    def _on_checkpoint_help(self):
+        """Solicita la ayuda del checkpoint del problema actual."""
         if self.current_issue:
-            # Agregar marca de revisado al problema
-            self.current_issue["reviewed"] = True
-            
-            # Actualizar visualización
-            current_item = self.problems_tree.currentItem()
-            if current_item:
-                font = current_item.font(2)
-                font.setStrikeOut(True)
-                current_item.setFont(2, font)
-                
-                # Cambiar color a gris
-                for col in range(self.problems_tree.columnCount()):
-                    current_item.setForeground(col, QColor(128, 128, 128))
+            checkpoint = self.current_issue["checkpoint"]
+            if checkpoint:
+                self.helpRequested.emit(checkpoint)
+    
+    def _set_reviewed(self, issues) -> int:
+        """
+        Marca problemas como revisados manteniendo índices, contadores y
+        filas del árbol sincronizados.
+        
+        Args:
+            issues: Problemas a marcar
             
-            self.status_label.setText("Problema marcado como revisado")
+        Returns:
+            int: Número de problemas que no estaban ya revisados
+        """
+        # Solo los que aún no están revisados, en una única pasada
+        reviewed_ids = self._reviewed_ids
+        pending = [issue for issue in issues if id(issue) not in reviewed_ids]
+        if not pending:
+            return 0
+        
+        # Evitar repintados y señales por cada fila durante la actualización;
+        # solo cambia el estilo, no hace falta rellenar de nuevo cada fila
+        item_by_issue_id = self._item_by_issue_id
+        self.problems_tree.setUpdatesEnabled(False)
+        self.problems_tree.blockSignals(True)
+        try:
+            for issue in pending:
+                issue["reviewed"] = True
+                reviewed_ids.add(id(issue))
+                issue_item = item_by_issue_id.get(id(issue))
+                if issue_item is not None:
+                    self._apply_reviewed_style(issue_item)
+        finally:
+            self.problems_tree.blockSignals(False)
+            self.problems_tree.setUpdatesEnabled(True)
+            self.problems_tree.viewport().update()
+        
+        # El panel de detalles se refresca una sola vez
+        if self.current_issue is not None and id(self.current_issue) in reviewed_ids:
+            self._update_details_panel(self.current_issue)
+        
+        self._stats["reviewed"] += len(pending)
+        self._update_statistics()
+        return len(pending)
     
     # Métodos de filtro
     def _on_severity_filter_changed(self, text):
         """Maneja cambios en el filtro de severidad."""
-        filter_map = {
-            "Todos": "all",
-            "Errores": "error",
-            "Advertencias": "warning",
-            "Información": "info"
-        }
-        self.severity_filter = filter_map.get(text, "all")
-        self._apply_filters()
+        severity_filter = _SEVERITY_FILTER_MAP.get(text, "all")
+        if severity_filter == self.severity_filter:
+            return
+        self.severity_filter = severity_filter
+        self.filter_timer.start()
     
     def _on_checkpoint_filter_changed(self, text):
         """Maneja cambios en el filtro de checkpoint."""
-        self.checkpoint_filter = "all" if text == "Todos" else text
-        self._apply_filters()
+        checkpoint_filter = "all" if text == "Todos" else text
+        if checkpoint_filter == self.checkpoint_filter:
+            return
+        self.checkpoint_filter = checkpoint_filter
+        self.filter_timer.start()
     
     def _on_fixable_filter_changed(self, text):
         """Maneja cambios en el filtro de reparable."""
-        filter_map = {
-            "Todos": "all",
-            "Sí": "yes",
-            "No": "no"
-        }
-        self.fixable_filter = filter_map.get(text, "all")
-        self._apply_filters()
+        fixable_filter = _FIXABLE_FILTER_MAP.get(text, "all")
+        if fixable_filter == self.fixable_filter:
+            return
+        self.fixable_filter = fixable_filter
+        self.filter_timer.start()
     
     def _on_search_changed(self, text):
         """Maneja cambios en el texto de búsqueda."""
         self.search_text = text
-        # Usar timer para búsqueda diferida
-        self.search_timer.stop()
-        self.search_timer.start(300)
+        
+        # Usar timer para búsqueda diferida, más largo durante ráfagas
+        now = time.monotonic()
+        in_burst = now - self._last_keystroke < _SEARCH_BURST_INTERVAL
+        self._last_keystroke = now
+        
+        if self._search_pending_since is None:
+            self._search_pending_since = now
+        elif now - self._search_pending_since >= _SEARCH_MAX_WAIT and self.search_timer.isActive():
+            # Dejar que el timer en curso venza para no retrasar indefinidamente
+            return
+        
+        self.search_timer.start(_SEARCH_BURST_DELAY_MS if in_burst else _SEARCH_DELAY_MS)
+    
+    def _on_search_timeout(self):
+        """Aplica la búsqueda diferida si el texto cambió desde la última aplicación."""
+        if self.search_text == self._last_applied_search:
+            self._search_pending_since = None
+            return
+        self._apply_filters()
     
     def _clear_filters(self):
         """Limpia todos los filtros."""
+        filters_active = (self.severity_filter != "all" or self.checkpoint_filter != "all" or
+                          self.fixable_filter != "all" or bool(self.search_text))
+        
         self.severity_combo.setCurrentIndex(0)  # "Todos"
         self.checkpoint_combo.setCurrentIndex(0)  # "Todos"
         self.fixable_combo.setCurrentIndex(0)  # "Todos"
@@ -660,7 +1086,12 @@ class ProblemsPanel(QWidget):
         self.fixable_filter = "all"
         self.search_text = ""
         
-        self._apply_filters()
+        if filters_active:
+            self._apply_filters()
+        else:
+            # Sin filtros activos la vista ya es la completa
+            self.filter_timer.stop()
+            self.search_timer.stop()
         self.status_label.setText("Filtros limpiados")
     
     def _export_issues(self):
@@ -670,9 +1101,6 @@ class ProblemsPanel(QWidget):
             return
         
         from PySide6.QtWidgets import QFileDialog
-        import json
-        import csv
-        from datetime import datetime
         
         # Seleccionar archivo
         file_path, selected_filter = QFileDialog.getSaveFileName(
@@ -685,50 +1113,55 @@ class ProblemsPanel(QWidget):
         if not file_path:
             return
         
-        try:
-            if "JSON" in selected_filter:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.filtered_issues, f, indent=2, ensure_ascii=False)
-                    
-            elif "CSV" in selected_filter:
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    # Encabezados
-                    writer.writerow(["Checkpoint", "Severidad", "Descripción", "Página", "Reparable", "Solución"])
-                    
-                    # Datos
-                    for issue in self.filtered_issues:
-                        writer.writerow([
-                            issue.get("checkpoint", ""),
-                            issue.get("severity", ""),
-                            issue.get("description", ""),
-                            issue.get("page", ""),
-                            "Sí" if issue.get("fixable", False) else "No",
-                            issue.get("fix_description", "")
-                        ])
-                        
-            else:  # Texto plano
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("INFORME DE PROBLEMAS DE ACCESIBILIDAD\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Total de problemas: {len(self.filtered_issues)}\n\n")
-                    
-                    for i, issue in enumerate(self.filtered_issues, 1):
-                        f.write(f"{i}. {issue.get('checkpoint', 'N/A')} - {issue.get('severity', '').upper()}\n")
-                        f.write(f"   Descripción: {issue.get('description', '')}\n")
-                        f.write(f"   Página: {issue.get('page', 'N/A')}\n")
-                        f.write(f"   Reparable: {'Sí' if issue.get('fixable', False) else 'No'}\n")
-                        if issue.get('fix_description'):
-                            f.write(f"   Solución: {issue.get('fix_description', '')}\n")
-                        f.write("\n")
-            
-            self.status_label.setText(f"Problemas exportados a {file_path}")
-            QTimer.singleShot(5000, lambda: self.status_label.setText("Listo"))
-            
-        except Exception as e:
-            logger.error(f"Error al exportar problemas: {e}")
-            QMessageBox.critical(self, "Error", f"Error al exportar problemas:\n{str(e)}")
+        # Escribir el archivo en segundo plano sobre una copia de la lista
+        if "JSON" in selected_filter:
+            export_format = "json"
+        elif "CSV" in selected_filter:
+            export_format = "csv"
+        else:
+            export_format = "txt"
+        
+        self.export_btn.setEnabled(False)
+        self._status_reset_timer.stop()
+        self.status_label.setText("Exportando problemas...")
+        
+        self._export_thread = ExportThread(file_path, export_format, list(self.filtered_issues))
+        self._export_thread.exportFinished.connect(self._on_export_finished)
+        self._export_thread.finished.connect(self._on_export_thread_finished)
+        self._export_thread.start()
+    
+    def _on_export_thread_finished(self):
+        """Libera el hilo de exportación cuando termina su ejecución."""
+        thread = self.sender()
+        if thread is self._export_thread:
+            self._export_thread = None
+        thread.deleteLater()
+    
+    def _wait_for_export_thread(self):
+        """Espera a que termine la exportación en curso, si la hay."""
+        if self._export_thread is not None and self._export_thread.isRunning():
+            self._export_thread.wait()
+    
+    def closeEvent(self, event):
+        """Espera a la exportación en curso antes de cerrar el panel."""
+        self._wait_for_export_thread()
+        super().closeEvent(event)
+    
+    def _on_export_finished(self, success: bool, message: str):
+        """
+        Maneja el fin de la exportación en segundo plano.
+        
+        Args:
+            success: True si el archivo se escribió correctamente
+            message: Ruta del archivo o mensaje de error
+        """
+        self.export_btn.setEnabled(True)
+        
+        if success:
+            self._flash_status(f"Problemas exportados a {message}", 5000)
+        else:
+            self.status_label.setText("Listo")
+            QMessageBox.critical(self, "Error", f"Error al exportar problemas:\n{message}")
     
     def get_current_issue(self) -> Optional[Dict]:
         """Obtiene el problema actualmente seleccionado."""
@@ -741,18 +1174,16 @@ class ProblemsPanel(QWidget):
         Args:
             checkpoint: ID del checkpoint
         """
-        for issue in self.filtered_issues:
-            if issue.get("checkpoint") == checkpoint:
-                # Buscar el item en el árbol
-                root = self.problems_tree.invisibleRootItem()
-                for i in range(root.childCount()):
-                    group_item = root.child(i)
-                    if group_item.text(1) == checkpoint:
-                        if group_item.childCount() > 0:
-                            first_issue_item = group_item.child(0)
-                            self.problems_tree.setCurrentItem(first_issue_item)
-                            self.problems_tree.scrollToItem(first_issue_item)
-                            return
+        # Grupo del checkpoint desde el índice creado con el árbol
+        group_item = self._group_items.get(checkpoint)
+        if group_item is None or group_item.isHidden():
+            return
+        
+        # Primer problema no oculto por los filtros
+        for _, issue_item in self._group_rows[checkpoint]:
+            if not issue_item.isHidden():
+                self.problems_tree.setCurrentItem(issue_item)
+                self.problems_tree.scrollToItem(issue_item)
                 break
     
     def highlight_issues_by_type(self, issue_type: str):
@@ -1,11 +1,98 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QComboBox, QLabel, QFileDialog)
+                             QComboBox, QLabel, QFileDialog, QApplication)
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtCore import QUrl, QTemporaryFile, QDir
+from PySide6.QtCore import QUrl, QDir, QThread, Signal, QSaveFile, QIODevice, QTemporaryFile
 from PySide6.QtGui import QDesktopServices
 
 from loguru import logger
-import os
+import copy
+
+# Tamaño de los bloques al escribir informes grandes
+_WRITE_CHUNK_SIZE = 64 * 1024
+
+# Tamaño máximo de un informe para cargarlo con setHtml (límite de Qt: 2 MB)
+_INLINE_HTML_MAX_SIZE = 256 * 1024
+
+class ReportExportThread(QThread):
+    """Hilo para generar y guardar un informe sin bloquear la interfaz."""
+    exportFinished = Signal(bool, str, str)  # éxito, ruta, mensaje de error
+    
+    def __init__(self, reporter, file_path, format_idx, html_content):
+        super().__init__()
+        # El hilo trabaja sobre una copia tomada en el hilo de la interfaz:
+        # el reporter compartido puede recibir nuevos datos durante la exportación
+        self.reporter = self._snapshot_reporter(reporter)
+        self.file_path = file_path
+        self.format_idx = format_idx
+        self.html_content = html_content
+        
+    def run(self):
+        try:
+            # Generar y guardar informe según formato
+            if self.format_idx == 0:  # HTML
+                # Escribir por bloques para no codificar todo el informe de una vez
+                content = self.html_content
+                self._save_atomically(
+                    content[start:start + _WRITE_CHUNK_SIZE]
+                    for start in range(0, len(content), _WRITE_CHUNK_SIZE)
+                )
+            elif self.format_idx == 1:  # PDF
+                if not self.reporter.generate_pdf_report(self.file_path):
+                    self.exportFinished.emit(False, self.file_path, "No se pudo generar el PDF")
+                    return
+            else:  # Texto plano
+                # El informe se escribe línea a línea, sin montarlo en memoria
+                self._save_atomically(writer=self.reporter.generate_text_report_stream)
+                    
+            self.exportFinished.emit(True, self.file_path, "")
+            
+        except Exception as e:
+            self.exportFinished.emit(False, self.file_path, str(e))
+    
+    @staticmethod
+    def _snapshot_reporter(reporter):
+        """
+        Crea una copia del reporter con sus propios datos del informe.
+        
+        Args:
+            reporter: Instancia de PDFUAReporter compartida con la interfaz
+            
+        Returns:
+            PDFUAReporter: Copia cuyos datos no cambian aunque cambie el original
+        """
+        snapshot = copy.copy(reporter)
+        snapshot.document_info = dict(reporter.document_info)
+        snapshot.issues = [dict(issue) for issue in reporter.issues]
+        snapshot.summary = dict(reporter.summary)
+        return snapshot
+            
+    def _save_atomically(self, chunks=(), writer=None):
+        """
+        Guarda texto en UTF-8 mediante QSaveFile: se escribe en un archivo
+        temporal que solo sustituye al destino si todo se escribió bien.
+        
+        Args:
+            chunks: Fragmentos de texto a escribir
+            writer: Función opcional que recibe la función de escritura
+        """
+        save_file = QSaveFile(self.file_path)
+        if not save_file.open(QIODevice.WriteOnly):
+            raise OSError(save_file.errorString())
+        
+        def write(text):
+            save_file.write(text.encode('utf-8'))
+        
+        try:
+            for chunk in chunks:
+                write(chunk)
+            if writer is not None:
+                writer(write)
+        except Exception:
+            save_file.cancelWriting()
+            raise
+        
+        if not save_file.commit():
+            raise OSError(save_file.errorString())
 
 class ReportView(QWidget):
     """
@@ -23,9 +110,18 @@ class ReportView(QWidget):
         super().__init__(parent)
         self.report_content = ""
         self.report_file = None
+        # Archivo temporal propiedad del visor: Qt lo elimina al destruir el widget
+        self._report_temp_file = None
         self.reporter = None
+        self._export_thread = None
         self._init_ui()
         
+        # El visor va empotrado en un dock y no recibe closeEvent al salir:
+        # esperar a la exportación en curso antes de que se destruya
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._wait_for_export_thread)
+        
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
         
@@ -52,31 +148,62 @@ class ReportView(QWidget):
         
         main_layout.addLayout(toolbar_layout)
         
-        # Visor web
-        self.web_view = QWebEngineView()
-        main_layout.addWidget(self.web_view)
+        # Visor web: se crea al cargar el primer informe para no arrancar
+        # el motor de Chromium si el usuario nunca abre un informe
+        self.web_view = None
+        self._web_view_placeholder = QWidget()
+        main_layout.addWidget(self._web_view_placeholder)
+        
+    def _ensure_web_view(self):
+        """Crea el visor web la primera vez que se necesita."""
+        if self.web_view is None:
+            self.web_view = QWebEngineView()
+            self.layout().replaceWidget(self._web_view_placeholder, self.web_view)
+            self._web_view_placeholder.deleteLater()
+            self._web_view_placeholder = None
+        return self.web_view
         
     def set_html_content(self, html_content):
         """Carga contenido HTML en el visor."""
+        if not html_content:
+            logger.warning("Se ignoró un informe HTML vacío")
+            return
+        
         self.report_content = html_content
+        self._ensure_web_view()
+        
+        # Los informes pequeños se cargan directamente, sin pasar por disco;
+        # la URL base es la misma carpeta que usaría el archivo temporal
+        if len(html_content) < _INLINE_HTML_MAX_SIZE:
+            self.web_view.setHtml(html_content, QUrl.fromLocalFile(QDir.tempPath() + "/"))
+            return
+        
+        # Un único archivo temporal por visor, sobrescrito en cada informe
+        if self._report_temp_file is None:
+            self._report_temp_file = QTemporaryFile(
+                QDir.tempPath() + "/pdfua_report_XXXXXX.html", self)
         
-        # Crear archivo temporal para el HTML
-        temp_file = QTemporaryFile(QDir.tempPath() + "/pdfua_report_XXXXXX.html")
-        if temp_file.open():
-            temp_file.write(html_content.encode('utf-8'))
+        temp_file = self._report_temp_file
+        if not temp_file.open() or not temp_file.resize(0):
+            logger.error(f"No se pudo crear archivo temporal para el informe HTML: "
+                         f"{temp_file.errorString()}")
             temp_file.close()
-            
-            # Guardar referencia al archivo temporal
-            self.report_file = temp_file.fileName()
-            
-            # Cargar el archivo en el visor
-            self.web_view.load(QUrl.fromLocalFile(self.report_file))
-            logger.info(f"Informe cargado desde archivo temporal: {self.report_file}")
-        else:
-            logger.error("No se pudo crear archivo temporal para el informe HTML")
             # Cargar directamente como datos
             self.web_view.setHtml(html_content)
-            
+            return
+        
+        temp_file.write(html_content.encode('utf-8'))
+        temp_file.close()
+        self.report_file = temp_file.fileName()
+        
+        # Cargar el archivo en el visor, o recargarlo si ya estaba cargado
+        report_url = QUrl.fromLocalFile(self.report_file)
+        if self.web_view.url() == report_url:
+            self.web_view.reload()
+        else:
+            self.web_view.load(report_url)
+        logger.info(f"Informe cargado desde archivo temporal: {self.report_file}")
+    
     def set_reporter(self, reporter):
         """Establece la instancia de PDFUAReporter para generar informes."""
         self.reporter = reporter
@@ -111,33 +238,43 @@ class ReportView(QWidget):
         if not file_path:
             return
             
-        try:
-            # Generar y guardar informe según formato
-            if format_idx == 0:  # HTML
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.report_content)
-            elif format_idx == 1:  # PDF
-                if self.reporter:
-                    self.reporter.generate_pdf_report(file_path)
-                else:
-                    logger.error("No se puede generar PDF sin reporter")
-                    return
-            else:  # Texto plano
-                if self.reporter:
-                    text_report = self.reporter.generate_text_report()
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(text_report)
-                else:
-                    logger.error("No se puede generar texto sin reporter")
-                    return
-                    
-            logger.info(f"Informe exportado a {file_path}")
-            
-            # Abrir el archivo exportado
-            QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+        # Generar el informe en segundo plano para no bloquear la interfaz
+        self.export_btn.setEnabled(False)
+        self._export_thread = ReportExportThread(self.reporter, file_path,
+                                                 format_idx, self.report_content)
+        self._export_thread.exportFinished.connect(self._on_export_finished)
+        self._export_thread.finished.connect(self._on_export_thread_finished)
+        self._export_thread.start()
+    
+    def _on_export_thread_finished(self):
+        """Libera el hilo de exportación cuando termina su ejecución."""
+        thread = self.sender()
+        if thread is self._export_thread:
+            self._export_thread = None
+        thread.deleteLater()
+    
+    def _wait_for_export_thread(self):
+        """Espera a que termine la exportación en curso, si la hay."""
+        if self._export_thread is not None and self._export_thread.isRunning():
+            self._export_thread.wait()
+    
+    def closeEvent(self, event):
+        """Espera a la exportación en curso antes de cerrar el visor."""
+        self._wait_for_export_thread()
+        super().closeEvent(event)
+        
+    def _on_export_finished(self, success, file_path, message):
+        """Maneja el fin de la exportación en segundo plano."""
+        self.export_btn.setEnabled(True)
+        
+        if not success:
+            logger.error(f"Error al exportar informe: {message}")
+            return
             
-        except Exception as e:
-            logger.error(f"Error al exportar informe: {str(e)}")
+        logger.info(f"Informe exportado a {file_path}")
+        
+        # Abrir el archivo exportado
+        QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
             
     def _on_print_clicked(self):
         """Maneja el clic en el botón de impresión."""
@@ -6,10 +6,87 @@ Relacionado con:
 - Tagged PDF: 5.1.1 (Color, BackgroundColor)
 """
 
+import functools
 import math
 import re
+from enum import IntEnum
 from loguru import logger
 
+# NumPy solo se importa dentro de las funciones vectorizadas, para que
+# importar este módulo siga siendo ligero
+
+# Coeficientes WCAG de luminosidad relativa para R, G y B
+_LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+# Ratios mínimos de contraste WCAG
+_AA_NORMAL = 4.5   # AA para texto normal
+_AA_LARGE = 3.0    # AA para texto grande
+_AAA_NORMAL = 7.0  # AAA para texto normal
+_AAA_LARGE = 4.5   # AAA para texto grande
+
+_BLACK = (0, 0, 0)
+_WHITE = (255, 255, 255)
+
+# Sugerencias de último recurso: negro sobre blanco y blanco sobre negro
+_FALLBACK_SUGGESTIONS = (
+    {
+        'text': _BLACK,
+        'background': _WHITE,
+        'ratio': 21.0,
+        'text_hex': '#000000',
+        'bg_hex': '#FFFFFF'
+    },
+    {
+        'text': _WHITE,
+        'background': _BLACK,
+        'ratio': 21.0,
+        'text_hex': '#FFFFFF',
+        'bg_hex': '#000000'
+    },
+)
+
+# Diccionario de colores básicos
+_COLOR_NAMES = {
+    'black': _BLACK,
+    'white': _WHITE,
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'cyan': (0, 255, 255),
+    'magenta': (255, 0, 255),
+    'gray': (128, 128, 128),
+    'grey': (128, 128, 128),
+    'silver': (192, 192, 192),
+    'maroon': (128, 0, 0),
+    'olive': (128, 128, 0),
+    'navy': (0, 0, 128),
+    'purple': (128, 0, 128),
+    'teal': (0, 128, 128)
+}
+
+def _srgb_to_linear(c):
+    """Convierte un canal sRGB normalizado (0-1) a su valor lineal según WCAG."""
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+# Valor lineal de cada posible canal entero 0-255
+_SRGB_LINEAR = tuple(_srgb_to_linear(c / 255) for c in range(256))
+
+@functools.lru_cache(maxsize=1)
+def _srgb_linear_array():
+    """Devuelve _SRGB_LINEAR como array de NumPy (se crea la primera vez)."""
+    import numpy as np
+    return np.array(_SRGB_LINEAR)
+
+# Rejilla de cambios de luminosidad para ajustar texto y fondo a la vez
+_GRID_DELTAS = tuple(range(-50, 51, 5))
+_GRID_MAX_SUGGESTIONS = 3
+
+# Patrones de color compilados una sola vez
+_RGB_RE = re.compile(r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)')
+_HEX_RE = re.compile(r'#(?:[0-9a-f]{3}|[0-9a-f]{6})')
+
+@functools.lru_cache(maxsize=512)
 def hex_to_rgb(hex_color):
     """
     Convierte un color hexadecimal a RGB.
@@ -30,7 +107,9 @@ def hex_to_rgb(hex_color):
         logger.warning(f"Formato de color hexadecimal inválido: {hex_color}")
         return (0, 0, 0)
         
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # Un solo análisis de 24 bits y separación de canales por desplazamiento
+    value = int(hex_color, 16)
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
 
 def rgb_to_hex(rgb):
     """
@@ -71,23 +150,31 @@ def rgb_to_hsl(rgb):
     Returns:
         tuple: (H, S, L) como (0-360, 0-100, 0-100)
     """
+    h, s, l = _rgb_to_hsl_exact(rgb)
+    return (round(h), round(s), round(l))
+
+def _rgb_to_hsl_exact(rgb):
+    """
+    Convierte un color RGB a HSL sin redondear, para cálculos posteriores.
+    
+    Args:
+        rgb (tuple): (R, G, B) como enteros 0-255
+        
+    Returns:
+        tuple: (H, S, L) como flotantes (0-360, 0-100, 0-100)
+    """
     r, g, b = [x / 255.0 for x in rgb]
     
     max_val = max(r, g, b)
     min_val = min(r, g, b)
     delta = max_val - min_val
+    max_plus_min = max_val + min_val
     
-    # Luminance
-    l = (max_val + min_val) / 2.0
-    
-    # Saturation
-    s = 0
-    if delta != 0 and l != 0 and l != 1:
-        s = delta / (1 - abs(2 * l - 1))
+    # Saturación y tono (un color acromático tiene delta 0)
+    h = s = 0.0
+    if delta:
+        s = delta / (1 - abs(max_plus_min - 1))
         
-    # Hue
-    h = 0
-    if delta != 0:
         if max_val == r:
             h = ((g - b) / delta) % 6
         elif max_val == g:
@@ -95,11 +182,7 @@ def rgb_to_hsl(rgb):
         else:  # max_val == b
             h = (r - g) / delta + 4
             
-    h = round(h * 60)
-    if h < 0:
-        h += 360
-        
-    return (h, round(s * 100), round(l * 100))
+    return (h * 60, s * 100, max_plus_min * 50)
 
 def hsl_to_rgb(hsl):
     """
@@ -122,10 +205,8 @@ def hsl_to_rgb(hsl):
         r = g = b = l
     else:
         def hue_to_rgb(p, q, t):
-            if t < 0:
-                t += 1
-            if t > 1:
-                t -= 1
+            # El módulo lleva t a [0, 1) sin ramas para cada extremo
+            t %= 1.0
             if t < 1/6:
                 return p + (q - p) * 6 * t
             if t < 1/2:
@@ -156,47 +237,36 @@ def extract_color(color_str):
     Returns:
         tuple: (R, G, B) como enteros 0-255, o None si no se pudo extraer
     """
-    # Diccionario de colores básicos
-    color_names = {
-        'black': (0, 0, 0),
-        'white': (255, 255, 255),
-        'red': (255, 0, 0),
-        'green': (0, 128, 0),
-        'blue': (0, 0, 255),
-        'yellow': (255, 255, 0),
-        'cyan': (0, 255, 255),
-        'magenta': (255, 0, 255),
-        'gray': (128, 128, 128),
-        'grey': (128, 128, 128),
-        'silver': (192, 192, 192),
-        'maroon': (128, 0, 0),
-        'olive': (128, 128, 0),
-        'navy': (0, 0, 128),
-        'purple': (128, 0, 128),
-        'teal': (0, 128, 128)
-    }
-    
     if not color_str:
         return None
         
-    # Eliminar espacios
-    color_str = color_str.strip().lower()
+    # Eliminar espacios; el análisis se cachea por cadena normalizada
+    return _parse_color(color_str.strip().lower())
+
+@functools.lru_cache(maxsize=1024)
+def _parse_color(color_str):
+    """
+    Analiza una cadena de color ya normalizada (sin espacios y en minúsculas).
     
+    Args:
+        color_str (str): Cadena de color normalizada
+        
+    Returns:
+        tuple: (R, G, B) como enteros 0-255, o None si no se pudo extraer
+    """
     # Verificar si es un nombre de color
-    if color_str in color_names:
-        return color_names[color_str]
+    if color_str in _COLOR_NAMES:
+        return _COLOR_NAMES[color_str]
         
-    # Verificar si es un color hexadecimal
+    # Verificar si es un color hexadecimal (validado antes de convertir)
     if color_str.startswith('#'):
-        try:
+        if _HEX_RE.fullmatch(color_str):
             return hex_to_rgb(color_str)
-        except ValueError:
-            logger.warning(f"Color hexadecimal inválido: {color_str}")
-            return None
+        logger.warning(f"Color hexadecimal inválido: {color_str}")
+        return None
             
     # Verificar si es RGB o RGBA
-    rgb_pattern = r'rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)'
-    match = re.match(rgb_pattern, color_str)
+    match = _RGB_RE.match(color_str)
     
     if match:
         try:
@@ -208,6 +278,49 @@ def extract_color(color_str):
     logger.warning(f"Formato de color no reconocido: {color_str}")
     return None
 
+def _to_rgb(color):
+    """
+    Devuelve el color como tupla RGB, analizando la cadena solo si hace falta.
+    Las listas se convierten en tuplas para que sirvan como clave de caché.
+    
+    Args:
+        color: Color en formato RGB (tuple o list), hex (str) o nombre (str)
+        
+    Returns:
+        tuple: (R, G, B) como enteros 0-255, o None si no se pudo extraer
+    """
+    if isinstance(color, tuple):
+        return color
+    if isinstance(color, list):
+        return tuple(color) if len(color) == 3 else None
+    return extract_color(color)
+
+@functools.lru_cache(maxsize=4096)
+def _rel_luminance(rgb):
+    """
+    Calcula la luminosidad relativa (L) de un color según la fórmula WCAG.
+    
+    Args:
+        rgb (tuple): (R, G, B) como enteros 0-255
+        
+    Returns:
+        float: Luminosidad relativa (0-1)
+    """
+    r, g, b = rgb
+    
+    # Canales enteros 0-255: valores lineales de la tabla precalculada
+    try:
+        if min(rgb) >= 0:
+            return 0.2126 * _SRGB_LINEAR[r] + 0.7152 * _SRGB_LINEAR[g] + 0.0722 * _SRGB_LINEAR[b]
+    except (IndexError, TypeError):
+        pass
+    
+    # Convertir RGB a valores lineales
+    r, g, b = [_srgb_to_linear(c/255) for c in rgb]
+    
+    # Calcular luminosidad
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
 def calculate_contrast_ratio(color1, color2):
     """
     Calcula el ratio de contraste entre dos colores según WCAG.
@@ -220,38 +333,85 @@ def calculate_contrast_ratio(color1, color2):
         float: Ratio de contraste (1-21)
     """
     # Convertir a RGB si no lo están
-    if not isinstance(color1, tuple):
-        color1 = extract_color(color1)
-    
-    if not isinstance(color2, tuple):
-        color2 = extract_color(color2)
+    color1 = _to_rgb(color1)
+    color2 = _to_rgb(color2)
         
     if color1 is None or color2 is None:
         logger.error("No se pudo calcular contraste con colores inválidos")
         return 1.0
     
-    # Calcular luminosidad relativa (L) para cada color según fórmula WCAG
-    def get_luminance(rgb):
-        r, g, b = [c/255 for c in rgb]
-        
-        # Convertir RGB a valores lineales
-        r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-        g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-        b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-        
-        # Calcular luminosidad
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+    # Un color sobre sí mismo nunca tiene contraste
+    if color1 == color2:
+        return 1.0
     
+    # El ratio es simétrico: ordenar el par para compartir entrada de caché
+    if color2 < color1:
+        color1, color2 = color2, color1
+    return _contrast_cached(color1, color2)
+
+@functools.lru_cache(maxsize=8192)
+def _contrast_cached(color1, color2):
+    """
+    Calcula el ratio de contraste entre dos colores RGB ya normalizados.
+    
+    Args:
+        color1 (tuple): (R, G, B) como enteros 0-255
+        color2 (tuple): (R, G, B) como enteros 0-255
+        
+    Returns:
+        float: Ratio de contraste (1-21)
+    """
     # Calcular luminosidades
-    L1 = get_luminance(color1)
-    L2 = get_luminance(color2)
+    L1 = _rel_luminance(color1)
+    L2 = _rel_luminance(color2)
     
     # Calcular ratio de contraste
+    return _contrast(L1, L2)
+
+def _contrast(L1, L2):
+    """
+    Calcula el ratio de contraste WCAG a partir de dos luminosidades relativas.
+    
+    Args:
+        L1 (float): Luminosidad relativa del primer color
+        L2 (float): Luminosidad relativa del segundo color
+        
+    Returns:
+        float: Ratio de contraste (1-21)
+    """
     if L1 > L2:
         return (L1 + 0.05) / (L2 + 0.05)
     else:
         return (L2 + 0.05) / (L1 + 0.05)
 
+def calculate_contrast_ratio_batch(colors1, colors2):
+    """
+    Calcula el ratio de contraste WCAG para muchos pares de colores a la vez.
+    
+    Args:
+        colors1: Colores RGB 0-255 como array (N, 3) o secuencia de tuplas
+        colors2: Colores RGB 0-255 como array (N, 3) o secuencia de tuplas
+        
+    Returns:
+        numpy.ndarray: Ratios de contraste (N,), con los mismos valores que
+        calculate_contrast_ratio para cada par
+    """
+    import numpy as np
+    
+    def get_luminance(colors):
+        rgb = np.asarray(colors, dtype=np.float64).reshape(-1, 3) / 255.0
+        
+        # Convertir RGB a valores lineales
+        linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        
+        # Calcular luminosidad
+        return linear @ np.array(_LUMINANCE_WEIGHTS)
+    
+    L1 = get_luminance(colors1)
+    L2 = get_luminance(colors2)
+    
+    return (np.maximum(L1, L2) + 0.05) / (np.minimum(L1, L2) + 0.05)
+
 def is_wcag_aa_compliant(ratio, is_large_text=False):
     """
     Verifica si un ratio de contraste cumple con WCAG AA.
@@ -263,9 +423,7 @@ def is_wcag_aa_compliant(ratio, is_large_text=False):
     Returns:
         bool: True si cumple WCAG AA
     """
-    if is_large_text:
-        return ratio >= 3.0  # AA para texto grande
-    return ratio >= 4.5      # AA para texto normal
+    return ratio >= (_AA_LARGE if is_large_text else _AA_NORMAL)
 
 def is_wcag_aaa_compliant(ratio, is_large_text=False):
     """
@@ -278,9 +436,176 @@ def is_wcag_aaa_compliant(ratio, is_large_text=False):
     Returns:
         bool: True si cumple WCAG AAA
     """
+    return ratio >= (_AAA_LARGE if is_large_text else _AAA_NORMAL)
+
+class WCAGLevel(IntEnum):
+    """Nivel WCAG de contraste alcanzado, ordenado de menor a mayor."""
+    FAIL = 0
+    AA = 1
+    AAA = 2
+
+def wcag_level(ratio, is_large_text=False):
+    """
+    Obtiene el máximo nivel WCAG que cumple un ratio de contraste, para no
+    tener que consultar AA y AAA por separado.
+    
+    Args:
+        ratio (float): Ratio de contraste
+        is_large_text (bool): True si es texto grande (18pt+ o 14pt+ bold)
+        
+    Returns:
+        WCAGLevel: FAIL, AA o AAA
+    """
     if is_large_text:
-        return ratio >= 4.5  # AAA para texto grande
-    return ratio >= 7.0      # AAA para texto normal
+        aa, aaa = _AA_LARGE, _AAA_LARGE
+    else:
+        aa, aaa = _AA_NORMAL, _AAA_NORMAL
+    
+    if ratio >= aaa:
+        return WCAGLevel.AAA
+    if ratio >= aa:
+        return WCAGLevel.AA
+    return WCAGLevel.FAIL
+
+def _find_min_lightness_shift(hsl, direction, fixed_luminance, target_ratio):
+    """
+    Busca por bisección el menor cambio de luminosidad HSL de un color que
+    alcanza el ratio de contraste objetivo frente a otro color fijo.
+    
+    Al mover la luminosidad en un sentido, el contraste primero baja (si el
+    color se acerca al fijo) y después solo sube, así que los desplazamientos
+    válidos forman un intervalo que llega hasta el extremo (0 o 100).
+    
+    Args:
+        hsl (tuple): (H, S, L) del color a modificar
+        direction (int): -1 para oscurecer, 1 para aclarar
+        fixed_luminance (float): Luminosidad relativa del color que no cambia
+        target_ratio (float): Ratio de contraste objetivo
+        
+    Returns:
+        tuple: ((R, G, B), ratio) del color encontrado, o None si ni el
+        extremo alcanza el objetivo
+    """
+    h, s, l = hsl
+    max_shift = math.ceil(l if direction < 0 else 100 - l)
+    if max_shift <= 0:
+        return None
+    
+    def candidate(shift):
+        rgb = hsl_to_rgb((h, s, min(100, max(0, l + direction * shift))))
+        return rgb, _contrast(_rel_luminance(rgb), fixed_luminance)
+    
+    best = candidate(max_shift)
+    if best[1] < target_ratio:
+        return None
+    
+    low, high = 1, max_shift
+    while low < high:
+        mid = (low + high) // 2
+        result = candidate(mid)
+        if result[1] >= target_ratio:
+            high = mid
+            best = result
+        else:
+            low = mid + 1
+            
+    return best
+
+def _lightness_variants(hsl, lightness):
+    """
+    Convierte a RGB un mismo tono y saturación con varias luminosidades.
+    Versión vectorizada de hsl_to_rgb.
+    
+    Args:
+        hsl (tuple): (H, S, L) del color base; L se ignora
+        lightness (numpy.ndarray): Luminosidades (0-100) a convertir
+        
+    Returns:
+        numpy.ndarray: Colores (N, 3) como enteros 0-255
+    """
+    import numpy as np
+    
+    h = hsl[0] / 360.0
+    s = hsl[1] / 100.0
+    l = np.asarray(lightness, dtype=np.float64) / 100.0
+    
+    if s == 0:
+        # Escala de grises
+        channels = np.stack([l, l, l], axis=1)
+    else:
+        q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+        p = 2 * l - q
+        
+        def hue_to_rgb(t):
+            t %= 1.0
+            return np.select([t < 1/6, t < 1/2, t < 2/3],
+                             [p + (q - p) * 6 * t, q, p + (q - p) * (2/3 - t) * 6],
+                             p)
+        
+        channels = np.stack([hue_to_rgb(h + 1/3), hue_to_rgb(h), hue_to_rgb(h - 1/3)], axis=1)
+        
+    return np.round(channels * 255).astype(np.intp)
+
+def _grid_suggestions(text_hsl, bg_hsl, target_ratio):
+    """
+    Evalúa de una vez una rejilla de cambios de luminosidad del texto y del
+    fondo y devuelve las combinaciones que cumplen el objetivo con el menor
+    cambio total. Solo se consideran cambios en ambos colores; los de un
+    solo color los cubre _find_min_lightness_shift.
+    
+    Args:
+        text_hsl (tuple): (H, S, L) del texto
+        bg_hsl (tuple): (H, S, L) del fondo
+        target_ratio (float): Ratio de contraste objetivo
+        
+    Returns:
+        list: Sugerencias con el mismo formato que suggest_accessible_colors
+    """
+    import numpy as np
+    
+    deltas = np.array(_GRID_DELTAS)
+    text_l = np.clip(text_hsl[2] + deltas, 0, 100)
+    bg_l = np.clip(bg_hsl[2] + deltas, 0, 100)
+    text_rgb = _lightness_variants(text_hsl, text_l)
+    bg_rgb = _lightness_variants(bg_hsl, bg_l)
+    
+    # Luminosidades por tabla y matriz de contrastes texto x fondo
+    srgb_linear = _srgb_linear_array()
+    weights = np.array(_LUMINANCE_WEIGHTS)
+    text_lum = srgb_linear[text_rgb] @ weights
+    bg_lum = srgb_linear[bg_rgb] @ weights
+    high = np.maximum(text_lum[:, None], bg_lum[None, :])
+    low = np.minimum(text_lum[:, None], bg_lum[None, :])
+    ratios = (high + 0.05) / (low + 0.05)
+    
+    text_shift = np.abs(text_l - text_hsl[2])
+    bg_shift = np.abs(bg_l - bg_hsl[2])
+    valid = (ratios >= target_ratio) & (text_shift[:, None] > 0) & (bg_shift[None, :] > 0)
+    
+    candidates = np.argwhere(valid)
+    if not len(candidates):
+        return []
+    cost = text_shift[candidates[:, 0]] + bg_shift[candidates[:, 1]]
+    
+    suggestions = []
+    seen = set()
+    for i, j in candidates[np.argsort(cost, kind="stable")]:
+        pair = (tuple(int(c) for c in text_rgb[i]), tuple(int(c) for c in bg_rgb[j]))
+        if pair in seen:
+            continue
+        seen.add(pair)
+        
+        suggestions.append({
+            'text': pair[0],
+            'background': pair[1],
+            'ratio': float(ratios[i, j]),
+            'text_hex': rgb_to_hex(pair[0]),
+            'bg_hex': rgb_to_hex(pair[1])
+        })
+        if len(suggestions) == _GRID_MAX_SUGGESTIONS:
+            break
+            
+    return suggestions
 
 def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
     """
@@ -302,11 +627,8 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
         }
     """
     # Convertir a RGB si no lo están
-    if not isinstance(text_color, tuple):
-        text_color = extract_color(text_color)
-    
-    if not isinstance(bg_color, tuple):
-        bg_color = extract_color(bg_color)
+    text_color = _to_rgb(text_color)
+    bg_color = _to_rgb(bg_color)
         
     if text_color is None or bg_color is None:
         logger.error("Colores inválidos para sugerencias")
@@ -316,8 +638,12 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
             'suggestions': []
         }
         
+    # Luminosidades originales, reutilizadas por todas las estrategias
+    text_luminance = _rel_luminance(text_color)
+    bg_luminance = _rel_luminance(bg_color)
+    
     # Calcular ratio original
-    original_ratio = calculate_contrast_ratio(text_color, bg_color)
+    original_ratio = _contrast(text_luminance, bg_luminance)
     is_compliant = original_ratio >= target_ratio
     
     # Si ya cumple, no hacemos sugerencias
@@ -329,18 +655,17 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
         }
         
     # Convertir a HSL para manipular
-    text_hsl = rgb_to_hsl(text_color)
-    bg_hsl = rgb_to_hsl(bg_color)
+    text_hsl = _rgb_to_hsl_exact(text_color)
+    bg_hsl = _rgb_to_hsl_exact(bg_color)
     
     suggestions = []
     
     # Estrategia 1: Oscurecer texto si es claro
     if text_hsl[2] > 50:
-        darker_text_hsl = (text_hsl[0], text_hsl[1], max(0, text_hsl[2] - 30))
-        darker_text_rgb = hsl_to_rgb(darker_text_hsl)
-        ratio = calculate_contrast_ratio(darker_text_rgb, bg_color)
+        found = _find_min_lightness_shift(text_hsl, -1, bg_luminance, target_ratio)
         
-        if ratio >= target_ratio:
+        if found:
+            darker_text_rgb, ratio = found
             suggestions.append({
                 'text': darker_text_rgb,
                 'background': bg_color,
@@ -351,11 +676,10 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
             
     # Estrategia 2: Aclarar texto si es oscuro
     if text_hsl[2] < 50:
-        lighter_text_hsl = (text_hsl[0], text_hsl[1], min(100, text_hsl[2] + 30))
-        lighter_text_rgb = hsl_to_rgb(lighter_text_hsl)
-        ratio = calculate_contrast_ratio(lighter_text_rgb, bg_color)
+        found = _find_min_lightness_shift(text_hsl, 1, bg_luminance, target_ratio)
         
-        if ratio >= target_ratio:
+        if found:
+            lighter_text_rgb, ratio = found
             suggestions.append({
                 'text': lighter_text_rgb,
                 'background': bg_color,
@@ -366,11 +690,10 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
             
     # Estrategia 3: Oscurecer fondo si es claro
     if bg_hsl[2] > 50:
-        darker_bg_hsl = (bg_hsl[0], bg_hsl[1], max(0, bg_hsl[2] - 30))
-        darker_bg_rgb = hsl_to_rgb(darker_bg_hsl)
-        ratio = calculate_contrast_ratio(text_color, darker_bg_rgb)
+        found = _find_min_lightness_shift(bg_hsl, -1, text_luminance, target_ratio)
         
-        if ratio >= target_ratio:
+        if found:
+            darker_bg_rgb, ratio = found
             suggestions.append({
                 'text': text_color,
                 'background': darker_bg_rgb,
@@ -381,11 +704,10 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
             
     # Estrategia 4: Aclarar fondo si es oscuro
     if bg_hsl[2] < 50:
-        lighter_bg_hsl = (bg_hsl[0], bg_hsl[1], min(100, bg_hsl[2] + 30))
-        lighter_bg_rgb = hsl_to_rgb(lighter_bg_hsl)
-        ratio = calculate_contrast_ratio(text_color, lighter_bg_rgb)
+        found = _find_min_lightness_shift(bg_hsl, 1, text_luminance, target_ratio)
         
-        if ratio >= target_ratio:
+        if found:
+            lighter_bg_rgb, ratio = found
             suggestions.append({
                 'text': text_color,
                 'background': lighter_bg_rgb,
@@ -394,26 +716,12 @@ def suggest_accessible_colors(text_color, bg_color, target_ratio=4.5):
                 'bg_hex': rgb_to_hex(lighter_bg_rgb)
             })
             
-    # Estrategia 5: Negro sobre blanco (último recurso)
+    # Estrategia 5: Ajustar texto y fondo a la vez
+    suggestions.extend(_grid_suggestions(text_hsl, bg_hsl, target_ratio))
+            
+    # Estrategia 6: Negro sobre blanco (último recurso)
     if len(suggestions) == 0:
-        black = (0, 0, 0)
-        white = (255, 255, 255)
-        
-        suggestions.append({
-            'text': black,
-            'background': white,
-            'ratio': 21.0,
-            'text_hex': '#000000',
-            'bg_hex': '#FFFFFF'
-        })
-        
-        suggestions.append({
-            'text': white,
-            'background': black,
-            'ratio': 21.0,
-            'text_hex': '#FFFFFF',
-            'bg_hex': '#000000'
-        })
+        suggestions.extend(dict(suggestion) for suggestion in _FALLBACK_SUGGESTIONS)
         
     # Ordenar por ratio de contraste
     suggestions.sort(key=lambda x: x['ratio'], reverse=True)
@@ -454,8 +762,7 @@ def get_color_visibility(color):
     Returns:
         str: 'light' o 'dark'
     """
-    if not isinstance(color, tuple):
-        color = extract_color(color)
+    color = _to_rgb(color)
         
     if color is None:
         return 'light'
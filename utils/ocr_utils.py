@@ -11,6 +11,8 @@ Relacionado con:
 """
 
 import os
+import atexit
+import functools
 import pytesseract
 from PIL import Image, ImageOps, ImageEnhance
 import cv2
@@ -18,11 +20,25 @@ import numpy as np
 import io
 import re
 import sys
+import hashlib
 from loguru import logger
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import concurrent.futures
+import multiprocessing
+
+# API persistente de Tesseract (opcional): evita lanzar un proceso por imagen
+try:
+    import tesserocr
+    HAVE_TESSEROCR = True
+except ImportError:
+    HAVE_TESSEROCR = False
+
+# Instancia de PyTessBaseAPI de cada proceso de trabajo de batch_process_images
+_worker_api = None
+_worker_lang = None
 
 # Verificar disponibilidad de Tesseract al importar el módulo
+@functools.lru_cache(maxsize=1)
 def _check_tesseract_available():
     """Verifica si Tesseract OCR está disponible en el sistema."""
     try:
@@ -53,7 +69,86 @@ SUPPORTED_LANGUAGES = {
     'rus': 'Russian'
 }
 
-def extract_text_from_image_data(image_bytes, lang='spa', config=''):
+# Caché en disco de resultados de OCR, indexada por el contenido de la imagen.
+# Desactivada por defecto: se activa globalmente con OCR_CACHE_ENABLED o en
+# cada llamada con use_cache=True. Conserva como máximo OCR_CACHE_MAX_ENTRIES
+# resultados y descarta primero los usados hace más tiempo
+OCR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdfua_ocr")
+OCR_CACHE_ENABLED = False
+OCR_CACHE_MAX_ENTRIES = 2000
+
+def _ocr_cache_key(data: bytes, *params) -> str:
+    """
+    Calcula la clave de caché de un OCR a partir de la imagen y sus parámetros.
+    
+    Args:
+        data: Contenido binario de la imagen
+        *params: Parámetros que afectan al resultado (idioma, configuración...)
+        
+    Returns:
+        str: Clave hexadecimal
+    """
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(repr(params).encode('utf-8'))
+    return digest.hexdigest()
+
+def _ocr_cache_get(key: str) -> Optional[str]:
+    """Devuelve el texto cacheado para una clave, o None si no existe."""
+    path = os.path.join(OCR_CACHE_DIR, key + ".txt")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return None
+    
+    # Marcar la entrada como usada recientemente para el descarte LRU
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return text
+
+def _ocr_cache_put(key: str, text: str):
+    """Guarda el texto de un OCR en la caché; los fallos solo se registran."""
+    try:
+        os.makedirs(OCR_CACHE_DIR, exist_ok=True)
+        path = os.path.join(OCR_CACHE_DIR, key + ".txt")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        _ocr_cache_evict()
+    except OSError as e:
+        logger.debug(f"No se pudo guardar el OCR en caché: {e}")
+
+def _ocr_cache_evict():
+    """Elimina las entradas usadas hace más tiempo si la caché supera su límite."""
+    with os.scandir(OCR_CACHE_DIR) as it:
+        entries = [entry for entry in it if entry.name.endswith(".txt")]
+    excess = len(entries) - OCR_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def clear_ocr_cache():
+    """Elimina todos los resultados guardados en la caché de OCR."""
+    try:
+        with os.scandir(OCR_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith((".txt", ".tmp")):
+                    os.remove(entry.path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"No se pudo vaciar la caché de OCR: {e}")
+
+def extract_text_from_image_data(image_bytes, lang='spa', config='', use_cache=None):
     """
     Extrae texto de datos binarios de imagen usando Tesseract OCR.
     
@@ -61,38 +156,55 @@ def extract_text_from_image_data(image_bytes, lang='spa', config=''):
         image_bytes (bytes): Datos binarios de la imagen
         lang (str): Idioma para OCR (spa, eng, fra, deu, etc.)
         config (str): Configuración adicional para Tesseract
+        use_cache (bool): Si se usa la caché en disco (None: según OCR_CACHE_ENABLED)
         
     Returns:
         str: Texto extraído
     """
-    if not _check_tesseract_available():
+    if not TESSERACT_AVAILABLE:
         return "OCR no disponible: Tesseract no instalado"
+    
+    # Reutilizar el resultado de esta misma imagen antes de decodificarla
+    cache_key = None
+    if use_cache is None:
+        use_cache = OCR_CACHE_ENABLED
+    if use_cache:
+        cache_key = _ocr_cache_key(image_bytes, 'image_data', lang, config)
+        cached = _ocr_cache_get(cache_key)
+        if cached is not None:
+            return cached
         
     try:
-        # Convertir bytes a imagen PIL
-        img = Image.open(io.BytesIO(image_bytes))
+        # Decodificar directamente a escala de grises en código nativo (sin GIL)
+        gray = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
         
-        # Verificar si la imagen necesita preprocesamiento
-        # Convertir a escala de grises si es color
-        if img.mode != 'L':
-            img = img.convert('L')
+        if gray is None:
+            # Formatos que OpenCV no decodifica (GIF, por ejemplo): recurrir a PIL
+            img = Image.open(io.BytesIO(image_bytes))
+            if img.mode != 'L':
+                img = img.convert('L')
+            gray = np.asarray(img)
         
         # Mejor resolución para OCR
-        if img.width < 1000 and img.height < 1000:
-            img = img.resize((img.width * 2, img.height * 2), Image.LANCZOS)
+        if gray.shape[0] < 1000 and gray.shape[1] < 1000:
+            gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
             
         # Procesar con Tesseract
-        text = pytesseract.image_to_string(img, lang=lang, config=config)
+        text = pytesseract.image_to_string(gray, lang=lang, config=config)
         
         # Limpiar resultado
         text = text.strip()
         
+        if cache_key:
+            _ocr_cache_put(cache_key, text)
+        
         return text
     except Exception as e:
         logger.error(f"Error en OCR: {str(e)}")
         return ""
 
-def extract_text_from_cv_image(cv_image: np.ndarray, lang: str = 'spa', config: str = '', preprocess: bool = True) -> str:
+def extract_text_from_cv_image(cv_image: np.ndarray, lang: str = 'spa', config: str = '',
+                               preprocess: bool = True, use_cache: Optional[bool] = None) -> str:
     """
     Extrae texto de una imagen OpenCV usando Tesseract OCR.
     
@@ -101,42 +213,81 @@ def extract_text_from_cv_image(cv_image: np.ndarray, lang: str = 'spa', config:
         lang: Idioma para OCR (spa, eng, fra, deu, etc.)
         config: Configuración adicional para Tesseract
         preprocess: Si se debe preprocesar la imagen para mejorar el OCR
+        use_cache: Si se usa la caché en disco (None: según OCR_CACHE_ENABLED)
         
     Returns:
         str: Texto extraído
     """
     if not TESSERACT_AVAILABLE:
         return ""
+    
+    # Reutilizar el resultado de esta misma imagen (píxeles y forma)
+    cache_key = None
+    if use_cache is None:
+        use_cache = OCR_CACHE_ENABLED
+    if use_cache:
+        cache_key = _ocr_cache_key(np.ascontiguousarray(cv_image).tobytes(), 'cv_image',
+                                   cv_image.shape, str(cv_image.dtype), lang, config, preprocess)
+        cached = _ocr_cache_get(cache_key)
+        if cached is not None:
+            return cached
         
     try:
         # Aplicar preprocesamiento si se solicita
         if preprocess:
             cv_image = preprocess_image_for_ocr(cv_image)
             
-        # Asegurar que la imagen está en RGB
-        if len(cv_image.shape) == 2 or cv_image.shape[2] == 1:
-            # Convertir a RGB si es grayscale
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_GRAY2RGB)
-        elif cv_image.shape[2] == 3:
-            # Asegurar que está en RGB, no BGR
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB)
+        # Tesseract binariza internamente: basta con un solo canal de grises
+        if cv_image.ndim == 3:
+            if cv_image.shape[2] == 1:
+                cv_image = cv_image[:, :, 0]
+            elif cv_image.shape[2] == 3:
+                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
             
-        # Procesar con Tesseract usando configuración optimizada
-        custom_config = f'-l {lang} --oem 1 --psm 3'
-        if config:
-            custom_config += f' {config}'
-            
-        text = pytesseract.image_to_string(cv_image, config=custom_config)
+        # En un proceso de trabajo con API persistente, evitar pytesseract
+        if _worker_api is not None and lang == _worker_lang and not config:
+            _worker_api.SetImage(Image.fromarray(cv_image))
+            text = _worker_api.GetUTF8Text()
+        else:
+            # Procesar con Tesseract usando configuración optimizada
+            custom_config = f'-l {lang} --oem 1 --psm 3'
+            if config:
+                custom_config += f' {config}'
+                
+            text = pytesseract.image_to_string(cv_image, config=custom_config)
         
         # Limpiar resultado
         text = text.strip()
         
+        if cache_key:
+            _ocr_cache_put(cache_key, text)
+        
         return text
     except Exception as e:
         logger.error(f"Error en OCR con CV image: {str(e)}")
         return ""
 
-def preprocess_image_for_ocr(cv_image: np.ndarray) -> np.ndarray:
+# Diferencia máxima de brillo medio entre zonas de la imagen (0-255) para
+# considerarla iluminada de forma uniforme
+_UNIFORM_LIGHTING_MAX_SPREAD = 40
+
+def _is_uniformly_lit(gray: np.ndarray) -> bool:
+    """
+    Indica si una imagen en grises tiene una iluminación uniforme, comparando
+    el brillo medio de una rejilla de 4x4 zonas.
+    
+    Args:
+        gray: Imagen en escala de grises
+        
+    Returns:
+        bool: True si basta un umbral global para binarizarla
+    """
+    if min(gray.shape[:2]) < 4:
+        return True
+    tiles = cv2.resize(gray, (4, 4), interpolation=cv2.INTER_AREA)
+    return int(tiles.max()) - int(tiles.min()) <= _UNIFORM_LIGHTING_MAX_SPREAD
+
+def preprocess_image_for_ocr(cv_image: np.ndarray, quality: str = 'fast') -> np.ndarray:
     """
     Preprocesa una imagen para mejorar resultados de OCR.
     Aplica técnicas como umbralización adaptativa, reducción de ruido,
@@ -144,33 +295,40 @@ def preprocess_image_for_ocr(cv_image: np.ndarray) -> np.ndarray:
     
     Args:
         cv_image: Imagen OpenCV
+        quality: 'fast' suaviza con un desenfoque gaussiano; 'high' usa un
+            filtro bilateral, que preserva mejor los bordes pero es mucho más lento
         
     Returns:
         np.ndarray: Imagen preprocesada
     """
     try:
-        # Convertir a escala de grises si no lo está
+        # Convertir a escala de grises si no lo está (los filtros siguientes
+        # no modifican su entrada, así que no hace falta copiarla)
         if len(cv_image.shape) == 3:
             gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = cv_image.copy()
-        
-        # Aplicar desenfoque bilateral para reducir ruido pero preservar bordes
-        blur = cv2.bilateralFilter(gray, 9, 75, 75)
+            gray = cv_image
         
-        # Aplicar umbral adaptativo
-        thresh = cv2.adaptiveThreshold(
-            blur, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-            cv2.THRESH_BINARY, 11, 2
-        )
+        # Reducir ruido: el gaussiano basta para binarizar texto; el bilateral
+        # preserva bordes a un coste muy superior
+        if quality == 'high':
+            blur = cv2.bilateralFilter(gray, 9, 75, 75)
+        else:
+            blur = cv2.GaussianBlur(gray, (5, 5), 0)
         
-        # Aplicar operaciones morfológicas para limpiar la imagen
-        kernel = np.ones((1, 1), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-        closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel)
+        if _is_uniformly_lit(blur):
+            # Con iluminación uniforme basta el umbral global de Otsu
+            _, thresh = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        else:
+            # Aplicar umbral adaptativo
+            thresh = cv2.adaptiveThreshold(
+                blur, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                cv2.THRESH_BINARY, 11, 2
+            )
         
-        # Aplicar filtro de mediana para reducir ruido
-        processed = cv2.medianBlur(closing, 3)
+        # Aplicar filtro de mediana para reducir ruido (una apertura/cierre con
+        # núcleo 1x1 no alteraría la imagen, así que no se aplica)
+        processed = cv2.medianBlur(thresh, 3)
         
         return processed
     except Exception as e:
@@ -203,48 +361,157 @@ def detect_if_image_has_text(cv_image: np.ndarray, confidence_threshold: float =
         # Procesar con Tesseract a nivel de análisis de página
         data = pytesseract.image_to_data(processed_image, output_type=pytesseract.Output.DICT)
         
-        # Contar palabras con confianza alta y calcular confianza promedio
-        n_boxes = len(data['text'])
-        confident_words = 0
-        confidence_sum = 0
-        confident_conf_sum = 0
+        # Confianzas de las palabras no vacías
+        confidences = [float(conf) for word, conf in zip(data['text'], data['conf']) if word.strip()]
         
-        # Palabras no vacías
-        non_empty_words = [i for i in range(n_boxes) if data['text'][i].strip()]
+        return _summarize_word_confidences(confidences, confidence_threshold)
+    except Exception as e:
+        logger.error(f"Error detectando texto en imagen: {str(e)}")
+        return {'has_text': False, 'confidence': 0.0, 'word_count': 0, 'text_type': 'unknown'}
+
+def _summarize_word_confidences(confidences: List[float], confidence_threshold: float) -> Dict[str, Any]:
+    """
+    Resume las confianzas por palabra de Tesseract en la información de
+    detección de texto que devuelve detect_if_image_has_text.
+    
+    Args:
+        confidences: Confianza (0-100) de cada palabra no vacía
+        confidence_threshold: Umbral de confianza (0-1)
         
-        for i in non_empty_words:
-            word_conf = float(data['conf'][i])
-            confidence_sum += word_conf
-            
-            if word_conf >= confidence_threshold * 100:
-                confident_words += 1
-                confident_conf_sum += word_conf
-        
-        # Calcular confianza promedio
-        avg_confidence = confidence_sum / max(len(non_empty_words), 1) / 100
-        
-        # Determinar tipo de texto (impreso vs manuscrito)
-        # Este es un heurístico básico; podría mejorarse con un modelo específico
-        text_type = 'unknown'
-        if confident_words > 0:
-            # Si la confianza es muy alta, probablemente sea texto impreso
-            if avg_confidence > 0.85:
-                text_type = 'printed'
-            # Si es moderada, podría ser manuscrito o mixto
-            elif avg_confidence > 0.6:
-                text_type = 'printed'  # Por defecto asumimos impreso
-            else:
-                text_type = 'handwritten'
+    Returns:
+        Dict: {'has_text', 'confidence', 'word_count', 'text_type'}
+    """
+    # Contar palabras con confianza alta y calcular confianza promedio
+    confident_words = sum(1 for conf in confidences if conf >= confidence_threshold * 100)
+    avg_confidence = sum(confidences) / max(len(confidences), 1) / 100
+    
+    # Determinar tipo de texto (impreso vs manuscrito)
+    # Este es un heurístico básico; podría mejorarse con un modelo específico
+    text_type = 'unknown'
+    if confident_words > 0:
+        # Si la confianza es muy alta, probablemente sea texto impreso
+        if avg_confidence > 0.85:
+            text_type = 'printed'
+        # Si es moderada, podría ser manuscrito o mixto
+        elif avg_confidence > 0.6:
+            text_type = 'printed'  # Por defecto asumimos impreso
+        else:
+            text_type = 'handwritten'
+    
+    return {
+        'has_text': confident_words > 0,
+        'confidence': avg_confidence,
+        'word_count': confident_words,
+        'text_type': text_type
+    }
+
+def _recognize_image_text(cv_image: np.ndarray, lang: str = 'eng',
+                          confidence_threshold: float = 0.5) -> Tuple[Dict[str, Any], str]:
+    """
+    Detecta y extrae el texto de una imagen con una sola pasada de Tesseract,
+    en lugar de detect_if_image_has_text seguido de extract_text_from_cv_image.
+    No usa la caché de OCR: además del texto necesita las confianzas por
+    palabra, que la caché no guarda.
+    
+    Args:
+        cv_image: Imagen OpenCV
+        lang: Idioma para OCR
+        confidence_threshold: Umbral de confianza (0-1)
         
-        return {
-            'has_text': confident_words > 0,
-            'confidence': avg_confidence,
-            'word_count': confident_words,
-            'text_type': text_type
-        }
+    Returns:
+        Tuple[Dict, str]: Información de detección (como detect_if_image_has_text) y texto extraído
+    """
+    if not TESSERACT_AVAILABLE:
+        return {'has_text': False, 'confidence': 0.0, 'word_count': 0, 'text_type': 'unknown'}, ""
+    
+    try:
+        processed_image = preprocess_image_for_ocr(cv_image)
+        
+        if _worker_api is not None and lang == _worker_lang:
+            # Las confianzas salen del mismo reconocimiento que el texto
+            _worker_api.SetImage(Image.fromarray(processed_image))
+            text = _worker_api.GetUTF8Text()
+            confidences = [float(conf) for conf in _worker_api.AllWordConfidences()]
+        else:
+            data = pytesseract.image_to_data(processed_image, config=f'-l {lang} --oem 1 --psm 3',
+                                             output_type=pytesseract.Output.DICT)
+            
+            # Reconstruir el texto agrupando las palabras por línea
+            confidences = []
+            lines = {}
+            for word, conf, block, par, line in zip(data['text'], data['conf'], data['block_num'],
+                                                    data['par_num'], data['line_num']):
+                if word.strip():
+                    confidences.append(float(conf))
+                    lines.setdefault((block, par, line), []).append(word)
+            text = '\n'.join(' '.join(words) for words in lines.values())
+        
+        return _summarize_word_confidences(confidences, confidence_threshold), text.strip()
     except Exception as e:
         logger.error(f"Error detectando texto en imagen: {str(e)}")
-        return {'has_text': False, 'confidence': 0.0, 'word_count': 0, 'text_type': 'unknown'}
+        return {'has_text': False, 'confidence': 0.0, 'word_count': 0, 'text_type': 'unknown'}, ""
+
+# Expresión regular de palabras de estimate_ocr_quality
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Letras latinas (en minúscula) entre los 256 primeros puntos de código; el
+# índice 255 ('ÿ') no lo es y recoge también los puntos de código mayores
+_LATIN_LETTER_TABLE = np.zeros(256, dtype=np.bool_)
+_LATIN_LETTER_TABLE[[ord(c) for c in 'abcdefghijklmnopqrstuvwxyzáéíóúüñ']] = True
+
+def _count_gibberish_words(words: List[str]) -> int:
+    """
+    Cuenta las palabras aparentemente sin sentido: las de más de dos
+    caracteres formadas por una sola letra repetida o sin ninguna letra
+    latina. Todas las palabras se analizan a la vez como un único array.
+    
+    Args:
+        words: Palabras en minúsculas
+        
+    Returns:
+        int: Número de palabras sin sentido
+    """
+    long_words = [word for word in words if len(word) > 2]
+    if not long_words:
+        return 0
+    
+    lengths = np.fromiter(map(len, long_words), dtype=np.intp, count=len(long_words))
+    starts = np.zeros(len(long_words), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    codes = np.frombuffer(''.join(long_words).encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    
+    # Por palabra: si contiene alguna letra latina y si algún carácter difiere del primero
+    has_latin = np.logical_or.reduceat(_LATIN_LETTER_TABLE[np.minimum(codes, 255)], starts)
+    differs = np.logical_or.reduceat(codes != np.repeat(codes[starts], lengths), starts)
+    
+    return int(np.count_nonzero(~differs | ~has_latin))
+
+def _is_expected_ocr_char(c: str) -> bool:
+    """Indica si un carácter es habitual en texto real (letra, dígito, espacio o puntuación)."""
+    return c.isalpha() or c.isspace() or c.isdigit() or c in '.,-:;?!()[]{}"\'/'
+
+# Clasificación precalculada de los 256 primeros puntos de código
+_EXPECTED_CHAR_TABLE = np.array([_is_expected_ocr_char(chr(i)) for i in range(256)], dtype=np.bool_)
+
+def _count_unexpected_chars(text: str) -> int:
+    """
+    Cuenta los caracteres extraños de un texto. Los puntos de código Latin-1
+    se clasifican de una vez con la tabla; el resto, uno a uno.
+    
+    Args:
+        text: Texto a analizar
+        
+    Returns:
+        int: Número de caracteres que no son letras, dígitos, espacios ni puntuación común
+    """
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    in_table = codes < 256
+    count = int(np.count_nonzero(~_EXPECTED_CHAR_TABLE[codes[in_table]]))
+    
+    if not in_table.all():
+        count += sum(1 for code in codes[~in_table].tolist()
+                     if not _is_expected_ocr_char(chr(code)))
+    return count
 
 def estimate_ocr_quality(ocr_text: str, min_length: int = 10, lang: str = 'es') -> Dict[str, Any]:
     """
@@ -278,7 +545,7 @@ def estimate_ocr_quality(ocr_text: str, min_length: int = 10, lang: str = 'es')
     
     # Contar caracteres no alfabéticos ni espacios
     total_chars = len(ocr_text)
-    non_alpha_count = sum(1 for c in ocr_text if not (c.isalpha() or c.isspace() or c.isdigit() or c in '.,-:;?!()[]{}"\'/'))
+    non_alpha_count = _count_unexpected_chars(ocr_text)
     
     # Calcular proporción de caracteres no alfabéticos
     non_alpha_ratio = non_alpha_count / total_chars if total_chars > 0 else 1.0
@@ -294,15 +561,8 @@ def estimate_ocr_quality(ocr_text: str, min_length: int = 10, lang: str = 'es')
         errors.append(f"{repeated_lines} líneas repetidas")
     
     # Detectar palabras sin sentido
-    words = re.findall(r'\b\w+\b', ocr_text.lower())
-    gibberish_words = 0
-    
-    # Palabras muy cortas o largas, o con patrones inusuales
-    for word in words:
-        if (len(word) > 2 and 
-            (all(c == word[0] for c in word) or  # Toda la palabra es la misma letra
-             re.match(r'^[^a-záéíóúüñ]{3,}$', word))):  # Palabra sin vocales
-            gibberish_words += 1
+    words = _WORD_RE.findall(ocr_text.lower())
+    gibberish_words = _count_gibberish_words(words)
     
     if words and gibberish_words / len(words) > 0.3:
         errors.append(f"{gibberish_words} palabras aparentemente sin sentido")
@@ -327,6 +587,24 @@ def estimate_ocr_quality(ocr_text: str, min_length: int = 10, lang: str = 'es')
         'length': len(ocr_text)
     }
 
+# Patrones comunes en diferentes idiomas
+_LANG_PATTERNS = {
+    'spa': ['de la', 'el ', 'la ', 'que ', 'en ', 'y ', 'por ', 'con ', 'para ', 'es ', 'ñ', 'á', 'é', 'í', 'ó', 'ú', 'ü'],
+    'eng': ['the ', 'and ', 'of ', 'to ', 'in ', 'is ', 'that ', 'for ', 'it ', 'with ', 'th', 'wh'],
+    'fra': ['le ', 'la ', 'les ', 'de ', 'et ', 'en ', 'que ', 'une ', 'pour ', 'dans ', 'ç', 'à', 'è', 'ê', 'ë', 'î', 'ï', 'ô', 'ù', 'û', 'ÿ'],
+    'deu': ['der ', 'die ', 'und ', 'den ', 'in ', 'von ', 'zu ', 'das ', 'mit ', 'dem ', 'ä', 'ö', 'ü', 'ß'],
+    'ita': ['il ', 'la ', 'di ', 'e ', 'che ', 'in ', 'per ', 'un ', 'del ', 'con ', 'è', 'à', 'ò', 'ù']
+}
+
+# Los mismos patrones en forma plana, alineados con el índice de su idioma
+_LANG_NAMES = tuple(_LANG_PATTERNS)
+_FLAT_PATTERNS = tuple(pattern for patterns in _LANG_PATTERNS.values() for pattern in patterns)
+_FLAT_PATTERN_LANG = np.array([i for i, patterns in enumerate(_LANG_PATTERNS.values()) for _ in patterns],
+                              dtype=np.intp)
+_FLAT_PATTERN_LENGTH = np.array([len(pattern) for pattern in _FLAT_PATTERNS], dtype=np.float64)
+_LANG_PATTERN_COUNT = np.array([len(patterns) for patterns in _LANG_PATTERNS.values()], dtype=np.float64)
+
+@functools.lru_cache(maxsize=256)
 def detect_text_language(text: str) -> str:
     """
     Detecta el idioma del texto basado en frecuencias de caracteres y patrones.
@@ -342,35 +620,17 @@ def detect_text_language(text: str) -> str:
     if not text or len(text) < 20:
         return 'eng'  # Por defecto inglés para textos muy cortos
     
-    # Diccionario de patrones comunes en diferentes idiomas
-    lang_patterns = {
-        'spa': ['de la', 'el ', 'la ', 'que ', 'en ', 'y ', 'por ', 'con ', 'para ', 'es ', 'ñ', 'á', 'é', 'í', 'ó', 'ú', 'ü'],
-        'eng': ['the ', 'and ', 'of ', 'to ', 'in ', 'is ', 'that ', 'for ', 'it ', 'with ', 'th', 'wh'],
-        'fra': ['le ', 'la ', 'les ', 'de ', 'et ', 'en ', 'que ', 'une ', 'pour ', 'dans ', 'ç', 'à', 'è', 'ê', 'ë', 'î', 'ï', 'ô', 'ù', 'û', 'ÿ'],
-        'deu': ['der ', 'die ', 'und ', 'den ', 'in ', 'von ', 'zu ', 'das ', 'mit ', 'dem ', 'ä', 'ö', 'ü', 'ß'],
-        'ita': ['il ', 'la ', 'di ', 'e ', 'che ', 'in ', 'per ', 'un ', 'del ', 'con ', 'è', 'à', 'ò', 'ù']
-    }
-    
-    # Contar ocurrencias de cada patrón
-    scores = {lang: 0 for lang in lang_patterns}
-    
-    for lang, patterns in lang_patterns.items():
-        for pattern in patterns:
-            pattern_count = text.lower().count(pattern)
-            # Ponderamos por longitud para evitar sesgos
-            scores[lang] += pattern_count * len(pattern)
+    text_lower = text.lower()
     
-    # Normalizar por cantidad de patrones
-    for lang in scores:
-        if lang_patterns[lang]:
-            scores[lang] /= len(lang_patterns[lang])
+    # Contar ocurrencias de cada patrón, ponderadas por su longitud para
+    # evitar sesgos y normalizadas por la cantidad de patrones del idioma
+    counts = np.fromiter((text_lower.count(pattern) for pattern in _FLAT_PATTERNS),
+                         dtype=np.float64, count=len(_FLAT_PATTERNS))
+    scores = np.bincount(_FLAT_PATTERN_LANG, weights=counts * _FLAT_PATTERN_LENGTH,
+                         minlength=len(_LANG_NAMES)) / _LANG_PATTERN_COUNT
     
-    # Determinar el idioma con mayor puntuación
-    best_lang = max(scores, key=scores.get)
-    
-    # Convertir a código Tesseract
-    lang_map = {'spa': 'spa', 'eng': 'eng', 'fra': 'fra', 'deu': 'deu', 'ita': 'ita'}
-    return lang_map.get(best_lang, 'eng')
+    # El idioma con mayor puntuación (sus claves ya son códigos de Tesseract)
+    return _LANG_NAMES[int(scores.argmax())]
 
 def determine_best_alt_text(ocr_text: str, file_name: str = '', 
                            confidence_threshold: float = 0.6,
@@ -405,14 +665,14 @@ def determine_best_alt_text(ocr_text: str, file_name: str = '',
     
     # Si el OCR es bueno, usarlo
     if ocr_quality['valid'] and ocr_quality['confidence'] >= confidence_threshold:
-        # Detectar idioma
-        lang = detect_text_language(ocr_text)
-        
         # Determinar si usar Alt o ActualText
         # PDF/UA recomienda ActualText para imágenes que son principalmente texto
         # (Checkpoint 13-008)
         attribute_type = 'ActualText' if is_text_image else 'Alt'
         
+        # Detectar idioma (los textos muy cortos no se analizan: inglés)
+        lang = detect_text_language(ocr_text) if len(ocr_text) >= 20 else 'eng'
+        
         return {
             'text': ocr_text,
             'attribute_type': attribute_type,
@@ -449,6 +709,75 @@ def determine_best_alt_text(ocr_text: str, file_name: str = '',
         'language': 'eng'
     }
 
+def _process_single_image(image_item):
+    """Procesa una sola imagen del lote (en un proceso de trabajo)."""
+    image_data = image_item.get('image_data')
+    filename = image_item.get('filename', '')
+    
+    # Convertir a imagen OpenCV para análisis: el OCR trabaja en escala de
+    # grises, así que se decodifica directamente a un solo canal
+    try:
+        nparr = np.frombuffer(image_data, np.uint8)
+        cv_image = cv2.imdecode(nparr, cv2.IMREAD_GRAYSCALE)
+        if cv_image is None:
+            raise ValueError("Formato de imagen no soportado")
+        
+        # Detectar si tiene texto y extraerlo en la misma pasada de Tesseract
+        text_info, ocr_text = _recognize_image_text(cv_image, lang='eng')
+        
+        # Usar el texto solo si es probable que la imagen lo tenga
+        if not (text_info['has_text'] and text_info['confidence'] > 0.4):
+            ocr_text = ""
+        
+        # Determinar mejor texto alternativo
+        alt_info = determine_best_alt_text(ocr_text, filename, image_info=text_info)
+        
+        # Devolver resultado completo
+        return {
+            'filename': filename,
+            'text_detected': text_info['has_text'],
+            'text_type': text_info['text_type'],
+            'text_confidence': text_info['confidence'],
+            'ocr_text': ocr_text,
+            'alt_text': alt_info['text'],
+            'attribute_type': alt_info['attribute_type'],
+            'confidence': alt_info['confidence'],
+            'language': alt_info['language']
+        }
+    except Exception as e:
+        logger.error(f"Error procesando imagen {filename}: {str(e)}")
+        return {
+            'filename': filename,
+            'error': str(e),
+            'text_detected': False,
+            'alt_text': f"Imagen {filename}",
+            'attribute_type': 'Alt',
+            'confidence': 0.0
+        }
+
+def _init_ocr_worker(lang: str):
+    """
+    Inicializa un proceso de trabajo de OCR: Tesseract de un solo hilo (los
+    procesos ya reparten los núcleos) y, si tesserocr está disponible, una
+    API cargada una sola vez para todas las imágenes del proceso.
+    
+    Args:
+        lang: Idioma con el que cargar el modelo de Tesseract
+    """
+    global _worker_api, _worker_lang
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+    
+    if HAVE_TESSEROCR:
+        try:
+            _worker_api = tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM.AUTO,
+                                                  oem=tesserocr.OEM.LSTM_ONLY)
+            _worker_lang = lang
+            # Liberar el modelo de Tesseract al terminar el proceso
+            atexit.register(_worker_api.End)
+        except Exception as e:
+            logger.warning(f"No se pudo iniciar tesserocr, se usará pytesseract: {e}")
+            _worker_api = None
+
 def batch_process_images(image_list: List[Dict[str, Any]], 
                        max_workers: int = 4) -> List[Dict[str, Any]]:
     """
@@ -462,62 +791,50 @@ def batch_process_images(image_list: List[Dict[str, Any]],
     Returns:
         List[Dict]: Lista de resultados con texto alternativo y metadatos
     """
-    results = []
+    return list(iter_batch_process_images(image_list, max_workers))
+
+def iter_batch_process_images(image_list: Iterable[Dict[str, Any]], 
+                              max_workers: int = 4) -> Iterator[Dict[str, Any]]:
+    """
+    Versión en streaming de batch_process_images para lotes grandes.
     
-    def process_single_image(image_item):
-        """Procesa una sola imagen del lote."""
-        image_data = image_item.get('image_data')
-        filename = image_item.get('filename', '')
+    Los resultados se generan a medida que terminan (no en el orden de
+    entrada) y nunca hay más de 4 imágenes por trabajador en curso, de modo
+    que la memoria no crece con el tamaño del lote; a cambio, cada imagen
+    se envía a los procesos solo cuando queda hueco.
+    
+    Args:
+        image_list: Diccionarios con {'image_data': bytes, 'filename': str}
+        max_workers: Número máximo de trabajadores en paralelo
         
-        # Convertir a imagen OpenCV para análisis
-        try:
-            nparr = np.frombuffer(image_data, np.uint8)
-            cv_image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            # Detectar si tiene texto
-            text_info = detect_if_image_has_text(cv_image)
-            
-            # Extraer texto si es probable que lo tenga
-            ocr_text = ""
-            if text_info['has_text'] and text_info['confidence'] > 0.4:
-                # Detectar idioma para mejor OCR
-                lang = 'eng'  # Por defecto inglés
-                ocr_text = extract_text_from_cv_image(cv_image, lang=lang, preprocess=True)
+    Returns:
+        Iterator[Dict]: Resultados con texto alternativo y metadatos
+    """
+    max_in_flight = max_workers * 4
+    images = iter(image_list)
+    
+    # Procesar imágenes en paralelo en procesos: Tesseract apenas escala con hilos.
+    # Se usa "spawn" porque hacer fork con hilos de Qt activos puede bloquearse
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ocr_worker,
+            initargs=('eng',)) as executor:
+        pending = set()
+        while True:
+            # Rellenar la ventana de trabajo en curso
+            for img in images:
+                pending.add(executor.submit(_process_single_image, img))
+                if len(pending) >= max_in_flight:
+                    break
             
-            # Determinar mejor texto alternativo
-            alt_info = determine_best_alt_text(ocr_text, filename, image_info=text_info)
+            if not pending:
+                break
             
-            # Devolver resultado completo
-            return {
-                'filename': filename,
-                'text_detected': text_info['has_text'],
-                'text_type': text_info['text_type'],
-                'text_confidence': text_info['confidence'],
-                'ocr_text': ocr_text,
-                'alt_text': alt_info['text'],
-                'attribute_type': alt_info['attribute_type'],
-                'confidence': alt_info['confidence'],
-                'language': alt_info['language']
-            }
-        except Exception as e:
-            logger.error(f"Error procesando imagen {filename}: {str(e)}")
-            return {
-                'filename': filename,
-                'error': str(e),
-                'text_detected': False,
-                'alt_text': f"Imagen {filename}",
-                'attribute_type': 'Alt',
-                'confidence': 0.0
-            }
-    
-    # Procesar imágenes en paralelo
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_image = {executor.submit(process_single_image, img): img for img in image_list}
-        for future in concurrent.futures.as_completed(future_to_image):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error en procesamiento paralelo: {str(e)}")
-    
-    return results
\ No newline at end of file
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error(f"Error en procesamiento paralelo: {str(e)}")
\ No newline at end of file
@@ -6,13 +6,35 @@ Relacionado con:
 - Tagged PDF: 3.2.1 (semántica apropiada), 3.2.2 (orden de lectura)
 """
 
+import os
 import re
+import concurrent.futures
+import multiprocessing
 import fitz  # PyMuPDF
 import numpy as np
-from collections import defaultdict
+from statistics import fmean
 from typing import Dict, List, Tuple, Optional, Any, Union
 from loguru import logger
 
+# Flags de get_text("dict") sin TEXT_PRESERVE_IMAGES: aquí solo se usan los
+# bloques de texto y así MuPDF no copia los datos de cada imagen al diccionario
+_TEXT_DICT_FLAGS = fitz.TEXTFLAGS_TEXT
+
+# Marcadores de elementos de lista
+_BULLET_MARKER = r'[•⦿⦾○●◦▪▫]'  # Bullets
+_NUMBERED_MARKER = (
+    r'\d+\.'             # Números con punto
+    r'|\(\d+\)'          # Números con paréntesis
+    r'|[a-z]\)'          # Letras con paréntesis
+    r'|[ivxlcdm]+\.'     # Números romanos en minúsculas
+    r'|[IVXLCDM]+\.'     # Números romanos en mayúsculas
+)
+
+# Una sola expresión por tipo de lista: el motor recorre el texto una vez
+_BULLET_RE = re.compile(rf'^\s*{_BULLET_MARKER}\s')
+_NUMBERED_RE = re.compile(rf'^\s*(?:{_NUMBERED_MARKER})\s')
+_LIST_RE = re.compile(rf'^\s*(?:{_BULLET_MARKER}|{_NUMBERED_MARKER})\s')
+
 
 def extract_text_by_area(page, rect) -> str:
     """
@@ -53,30 +75,53 @@ def get_visual_elements(page, include_invisible=False) -> List[Dict]:
     
     try:
         # Obtener bloques de texto
-        blocks = page.get_text("dict")["blocks"]
+        blocks = page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]
         for block in blocks:
             if block["type"] == 0:  # Bloque de texto
                 for line in block["lines"]:
                     for span in line["spans"]:
+                        flags = span.get("flags", 0)
                         # Verificar si es texto invisible (modo de renderizado 3)
-                        is_invisible = span.get("flags", 0) & 16 > 0  # bit 4 es invisible
+                        is_invisible = flags & 16 > 0  # bit 4 es invisible
                         if not is_invisible or include_invisible:
                             elements.append({
                                 "type": "text",
-                                "rect": [span["bbox"][0], span["bbox"][1], span["bbox"][2], span["bbox"][3]],
+                                "rect": list(span["bbox"]),
                                 "text": span["text"],
                                 "font": span["font"],
                                 "size": span["size"],
                                 "color": span["color"],
-                                "flags": span.get("flags", 0),
-                                "is_bold": bool(span.get("flags", 0) & 2),  # bit 1 es negrita
-                                "is_italic": bool(span.get("flags", 0) & 1)  # bit 0 es cursiva
+                                "flags": flags,
+                                "is_bold": bool(flags & 2),  # bit 1 es negrita
+                                "is_italic": bool(flags & 1)  # bit 0 es cursiva
                             })
         
+        # Posiciones de todas las imágenes en una sola pasada por el contenido
+        # de la página, agrupadas por xref
+        placements = {}
+        for info in page.get_image_info(xrefs=True):
+            placements.setdefault(info["xref"], []).append(info["bbox"])
+        
+        images = page.get_images(full=True)
+        image_counts = {}
+        for img in images:
+            image_counts[img[0]] = image_counts.get(img[0], 0) + 1
+        
+        # get_image_info da coordenadas sin rotar; get_image_bbox, de la página rotada
+        rotation_matrix = page.rotation_matrix if page.rotation else None
+        
         # Obtener imágenes
-        for img_index, img in enumerate(page.get_images(full=True)):
+        for img_index, img in enumerate(images):
             xref = img[0]
-            bbox = page.get_image_bbox(img)
+            xref_placements = placements.get(xref, [])
+            if image_counts[xref] == 1 and len(xref_placements) == 1:
+                # Una sola imagen colocada una sola vez: la correspondencia es unívoca
+                bbox = fitz.Rect(xref_placements[0])
+                if rotation_matrix is not None:
+                    bbox = bbox * rotation_matrix
+            else:
+                # Xrefs repetidos o sin colocación conocida: cálculo individual
+                bbox = page.get_image_bbox(img)
             if bbox:
                 elements.append({
                     "type": "image",
@@ -107,31 +152,33 @@ def get_visual_elements(page, include_invisible=False) -> List[Dict]:
         
         # Obtener anotaciones (incluyendo formularios)
         for annot in page.annots():
+            # Solo incluir anotaciones visibles (no ocultas); las ocultas se
+            # descartan antes de consultar el resto de sus propiedades
+            if annot.flags & 2:  # bit 1 es Hidden flag
+                continue
+            
             annot_type = annot.type[1]
-            annot_rect = list(annot.rect)
             
-            # Solo incluir anotaciones visibles (no ocultas)
-            if annot.flags & 2 == 0:  # bit 1 es Hidden flag
-                annot_element = {
-                    "type": "annotation",
-                    "subtype": annot_type,
-                    "rect": annot_rect,
-                    "contents": annot.info.get("content", "")
-                }
-                
-                # Extraer información específica según tipo
-                if annot_type == "Widget":  # Formulario
-                    field_type = annot.widget_type
-                    annot_element["field_type"] = field_type
-                    annot_element["field_name"] = annot.field_name if hasattr(annot, "field_name") else ""
-                    annot_element["field_value"] = annot.field_value if hasattr(annot, "field_value") else ""
-                    
-                    # Buscar texto alternativo (TU - texto de interfaz de usuario)
-                    tu = _get_field_tu(annot)
-                    if tu:
-                        annot_element["tu"] = tu
+            annot_element = {
+                "type": "annotation",
+                "subtype": annot_type,
+                "rect": list(annot.rect),
+                "contents": annot.info.get("content", "")
+            }
+            
+            # Extraer información específica según tipo
+            if annot_type == "Widget":  # Formulario
+                # getattr lee cada propiedad una sola vez (hasattr ya la evaluaba)
+                annot_element["field_type"] = annot.widget_type
+                annot_element["field_name"] = getattr(annot, "field_name", "")
+                annot_element["field_value"] = getattr(annot, "field_value", "")
                 
-                elements.append(annot_element)
+                # Buscar texto alternativo (TU - texto de interfaz de usuario)
+                tu = _get_field_tu(annot)
+                if tu:
+                    annot_element["tu"] = tu
+            
+            elements.append(annot_element)
         
         return elements
     except Exception as e:
@@ -184,37 +231,22 @@ def detect_reading_order(elements: List[Dict]) -> List[int]:
         y_tolerance = min(10, max(3, _calculate_dynamic_y_tolerance(elements)))
         
         # Ordenar elementos inicialmente por Y (top-to-bottom)
-        sorted_elements = sorted(enumerate(elements), key=lambda x: x[1]["rect"][1])
-        
-        # Agrupar en líneas
-        lines = []
-        current_line = []
-        current_y_min = None
-        current_y_max = None
-        
-        for idx, elem in sorted_elements:
-            y_top = elem["rect"][1]
-            y_bottom = elem["rect"][3]
-            
-            # Primera línea o nuevo elemento está en otra línea
-            if current_y_min is None or y_top > current_y_max + y_tolerance:
-                # Si ya teníamos elementos, guardar línea actual
-                if current_line:
-                    lines.append(current_line)
-                
-                # Iniciar nueva línea
-                current_line = [(idx, elem)]
-                current_y_min = y_top
-                current_y_max = y_bottom
-            else:
-                # Elemento en la misma línea
-                current_line.append((idx, elem))
-                current_y_min = min(current_y_min, y_top)
-                current_y_max = max(current_y_max, y_bottom)
-        
-        # Añadir última línea
-        if current_line:
-            lines.append(current_line)
+        rects = np.array([elem["rect"] for elem in elements], dtype=np.float64)
+        order = np.argsort(rects[:, 1], kind="stable")
+        y_tops = rects[order, 1]
+        y_bottoms = rects[order, 3]
+        
+        # Agrupar en líneas: un elemento abre línea si empieza por debajo del
+        # borde inferior de la línea actual más la tolerancia. Como la nueva
+        # línea empieza por debajo de todo lo anterior, ese borde coincide con
+        # el máximo acumulado de los bordes inferiores
+        current_y_max = np.maximum.accumulate(y_bottoms)
+        new_line = y_tops[1:] > current_y_max[:-1] + y_tolerance
+        line_breaks = np.flatnonzero(new_line) + 1
+        
+        # tolist(): índices int de Python, no np.int64 (el resultado debe ser serializable)
+        lines = [[(idx, elements[idx]) for idx in line_idx.tolist()]
+                 for line_idx in np.split(order, line_breaks)]
         
         # Ordenar elementos dentro de cada línea por X (left-to-right)
         # y considerar columnas si están presentes
@@ -250,16 +282,13 @@ def _calculate_dynamic_y_tolerance(elements: List[Dict]) -> float:
         float: Tolerancia Y calculada
     """
     # Recopilar alturas de texto
-    text_heights = []
-    for elem in elements:
-        if elem["type"] == "text":
-            height = elem["rect"][3] - elem["rect"][1]
-            if height > 0:
-                text_heights.append(height)
+    heights = np.fromiter((elem["rect"][3] - elem["rect"][1] for elem in elements if elem["type"] == "text"),
+                          dtype=np.float64)
+    text_heights = heights[heights > 0]
     
     # Calcular tolerancia basada en altura promedio
-    if text_heights:
-        mean_height = sum(text_heights) / len(text_heights)
+    if text_heights.size:
+        mean_height = float(text_heights.mean())
         # Usar 2/3 de la altura promedio como tolerancia
         return max(3, mean_height * 0.67)
     else:
@@ -297,6 +326,11 @@ def _detect_columns(elements: List[Dict]) -> List[Tuple[float, float]]:
         page_left = min(left_margins) if left_margins else 0
         page_right = max(right_margins) if right_margins else 100
         
+        # Caso habitual de una sola columna: si todos los márgenes izquierdos
+        # están a menos del umbral del primero, forman un único grupo
+        if max(left_margins) - page_left < 20:
+            return [(page_left, page_right)]
+        
         # Agrupar márgenes izquierdos usando clustering
         grouped_margins = _cluster_values(left_margins, threshold=20)
         
@@ -350,30 +384,26 @@ def _cluster_values(values: List[float], threshold: float) -> List[float]:
     Returns:
         List[float]: Representantes de cada grupo
     """
-    if not values:
+    if len(values) == 0:
         return []
     
     # Ordenar valores
-    sorted_values = sorted(values)
-    
-    # Inicializar grupos
-    groups = []
-    current_group = [sorted_values[0]]
+    sorted_values = np.sort(np.asarray(values, dtype=np.float64))
     
-    # Agrupar valores similares
-    for value in sorted_values[1:]:
-        if value - current_group[0] < threshold:
-            current_group.append(value)
-        else:
-            # Calcular promedio del grupo actual
-            groups.append(sum(current_group) / len(current_group))
-            current_group = [value]
+    # Cada grupo reúne los valores a menos de `threshold` de su primer valor;
+    # se salta de grupo en grupo con búsqueda binaria en lugar de valor a valor
+    starts = []
+    start = 0
+    while start < len(sorted_values):
+        starts.append(start)
+        start = int(np.searchsorted(sorted_values, sorted_values[start] + threshold, side='left'))
+        start = max(start, starts[-1] + 1)
     
-    # Añadir último grupo
-    if current_group:
-        groups.append(sum(current_group) / len(current_group))
+    # Promedio de cada grupo
+    sums = np.add.reduceat(sorted_values, starts)
+    counts = np.diff(np.append(starts, len(sorted_values)))
     
-    return groups
+    return (sums / counts).tolist()
 
 
 def _apply_column_based_order(lines: List[List[Tuple]], elements: List[Dict], 
@@ -389,41 +419,46 @@ def _apply_column_based_order(lines: List[List[Tuple]], elements: List[Dict],
     Returns:
         List[int]: Índices en orden de lectura
     """
+    if not lines:
+        return []
+    
     # Asignar cada línea a su columna principal
     column_lines = [[] for _ in range(len(columns))]
     
-    for line in lines:
-        # Para cada línea, determinar en qué columna está principalmente
-        col_counts = [0] * len(columns)
-        
-        for idx, elem in line:
-            # Rectángulo del elemento
-            x_min = elem["rect"][0]
-            x_max = elem["rect"][2]
-            
-            # Verificar solapamiento con cada columna
-            for i, (col_min, col_max) in enumerate(columns):
-                # Si el elemento está principalmente en esta columna
-                if x_min >= col_min and x_max <= col_max:
-                    col_counts[i] += 1
-                    break
-                # Si hay solapamiento parcial, considerar la de mayor área
-                elif max(0, min(x_max, col_max) - max(x_min, col_min)) > 0:
-                    overlap = max(0, min(x_max, col_max) - max(x_min, col_min))
-                    elem_width = x_max - x_min
-                    if overlap / elem_width > 0.5:  # >50% en esta columna
-                        col_counts[i] += 1
-        
-        # Asignar la línea a la columna con más elementos
-        if sum(col_counts) > 0:
-            main_column = col_counts.index(max(col_counts))
-            column_lines[main_column].append(line)
-        else:
-            # Si no se puede determinar, asignar a la columna que mejor se alinee
-            middle_x = sum(elem["rect"][0] + elem["rect"][2] for _, elem in line) / (2 * len(line))
-            distances = [abs(middle_x - (col[0] + col[1])/2) for col in columns]
-            main_column = distances.index(min(distances))
-            column_lines[main_column].append(line)
+    # Límites y centros de columna, calculados una sola vez
+    col_mins = np.array([col[0] for col in columns], dtype=np.float64)
+    col_maxs = np.array([col[1] for col in columns], dtype=np.float64)
+    col_mids = (col_mins + col_maxs) / 2
+    col_ids = np.arange(len(columns))
+    
+    # Extremos horizontales de todos los elementos, línea tras línea
+    line_lengths = np.array([len(line) for line in lines])
+    line_starts = np.concatenate(([0], np.cumsum(line_lengths)[:-1]))
+    x_mins = np.array([elem["rect"][0] for line in lines for _, elem in line], dtype=np.float64)[:, None]
+    x_maxs = np.array([elem["rect"][2] for line in lines for _, elem in line], dtype=np.float64)[:, None]
+    
+    # Si el elemento está principalmente en una columna, cuenta para la primera
+    # que lo contiene; antes de ella, para las que cubren más del 50% de su ancho
+    contained = (x_mins >= col_mins) & (x_maxs <= col_maxs)
+    overlap = np.maximum(0, np.minimum(x_maxs, col_maxs) - np.maximum(x_mins, col_mins))
+    widths = np.broadcast_to(x_maxs - x_mins, overlap.shape)
+    overlap_ratio = np.divide(overlap, widths, out=np.zeros_like(overlap), where=overlap > 0)
+    partial = ~contained & (overlap_ratio > 0.5)
+    
+    first_contained = np.where(contained.any(axis=1), contained.argmax(axis=1), len(columns))[:, None]
+    counted = (partial & (col_ids < first_contained)) | (col_ids == first_contained)
+    
+    # Elementos de cada línea en cada columna
+    col_counts = np.add.reduceat(counted.astype(np.intp), line_starts, axis=0)
+    
+    # Si no se puede determinar, asignar a la columna que mejor se alinee
+    middle_x = np.add.reduceat((x_mins + x_maxs)[:, 0], line_starts) / (2 * line_lengths)
+    nearest = np.abs(middle_x[:, None] - col_mids).argmin(axis=1)
+    
+    # Asignar la línea a la columna con más elementos
+    main_columns = np.where(col_counts.sum(axis=1) > 0, col_counts.argmax(axis=1), nearest)
+    for line, main_column in zip(lines, main_columns.tolist()):
+        column_lines[main_column].append(line)
     
     # Reorganizar elementos en orden Z: de arriba a abajo por cada columna
     reading_order = []
@@ -447,7 +482,80 @@ def _apply_column_based_order(lines: List[List[Tuple]], elements: List[Dict],
     return reading_order
 
 
-def analyze_text_style(page, doc=None) -> Dict:
+def _font_size_totals(doc, pages) -> Tuple[float, int]:
+    """
+    Suma y cuenta los tamaños de fuente de los spans de unas páginas.
+    
+    Args:
+        doc (fitz.Document): Documento PyMuPDF
+        pages: Índices de las páginas a recorrer
+        
+    Returns:
+        Tuple[float, int]: Suma de tamaños y número de spans
+    """
+    total = 0.0
+    count = 0
+    for p in pages:
+        page_dict = doc[p].get_text("dict", flags=_TEXT_DICT_FLAGS)
+        for block in page_dict["blocks"]:
+            if block["type"] == 0:
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        total += span["size"]
+                        count += 1
+    return total, count
+
+
+def _file_font_size_totals(path: str, start: int, stop: int) -> Tuple[float, int]:
+    """Versión de _font_size_totals para un proceso de trabajo: abre su propia copia del archivo."""
+    with fitz.open(path) as doc:
+        return _font_size_totals(doc, range(start, stop))
+
+
+def calculate_document_avg_font_size(doc, workers: int = 1) -> float:
+    """
+    Calcula el tamaño medio de fuente de todo el documento. Recorre todas
+    las páginas, así que conviene calcularlo una vez y pasarlo a
+    analyze_text_style o detect_headings al analizar varias páginas.
+    
+    Con workers > 1, y si el documento está guardado en disco sin cambios
+    pendientes ni cifrado, las páginas se reparten entre procesos que abren
+    el archivo por su cuenta (PyMuPDF no admite hilos sobre un mismo
+    documento). Los procesos se crean con "spawn": hacer fork de un proceso
+    con hilos de Qt puede bloquearse. Cada proceso vuelve a abrir el archivo,
+    así que solo compensa en documentos largos.
+    
+    Args:
+        doc (fitz.Document): Documento PyMuPDF
+        workers: Número de procesos (1, por defecto, recorre el documento en este proceso)
+        
+    Returns:
+        float: Tamaño medio de fuente (12 si no hay texto)
+    """
+    page_count = len(doc)
+    workers = min(workers, page_count)
+    
+    total, count = 0.0, 0
+    if (workers > 1 and doc.name and os.path.isfile(doc.name)
+            and not doc.is_dirty and not doc.is_encrypted):
+        try:
+            bounds = np.linspace(0, page_count, workers + 1).astype(int).tolist()
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                for chunk_total, chunk_count in executor.map(_file_font_size_totals, [doc.name] * workers,
+                                                             bounds[:-1], bounds[1:]):
+                    total += chunk_total
+                    count += chunk_count
+        except Exception as e:
+            logger.debug(f"Recorrido paralelo de fuentes no disponible: {str(e)}")
+            total, count = _font_size_totals(doc, range(page_count))
+    else:
+        total, count = _font_size_totals(doc, range(page_count))
+    
+    return total / count if count else 12
+
+
+def analyze_text_style(page, doc=None, avg_font_size: Optional[float] = None) -> Dict:
     """
     Analiza estilos de texto en una página para identificar jerarquía visual.
     Útil para detectar encabezados, listas, etc.
@@ -455,13 +563,15 @@ def analyze_text_style(page, doc=None) -> Dict:
     Args:
         page (fitz.Page): Objeto página de PyMuPDF
         doc (fitz.Document): Documento completo (opcional)
+        avg_font_size: Tamaño medio de fuente del documento ya calculado con
+            calculate_document_avg_font_size (evita recorrer doc en cada página)
         
     Returns:
         dict: Información sobre jerarquía visual de la página
     """
     try:
         # Obtener bloques de texto
-        blocks = page.get_text("dict")["blocks"]
+        blocks = page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]
         
         # Recopilar información de estilos
         styles = {}
@@ -469,28 +579,12 @@ def analyze_text_style(page, doc=None) -> Dict:
         paragraphs = []
         list_items = []
         
-        # Patrones para detectar elementos de lista
-        list_patterns = [
-            r'^\s*[•⦿⦾⦿○●◦▪▫]\s',  # Bullets
-            r'^\s*\d+\.\s',         # Números con punto
-            r'^\s*\(\d+\)\s',       # Números con paréntesis
-            r'^\s*[a-z]\)\s',       # Letras con paréntesis
-            r'^\s*[ivxlcdm]+\.\s',  # Números romanos en minúsculas
-            r'^\s*[IVXLCDM]+\.\s',  # Números romanos en mayúsculas
-        ]
-        
         # Calcular estadísticas de tamaño de fuente si hay documento
-        font_sizes = []
-        if doc:
-            for p in range(len(doc)):
-                page_dict = doc[p].get_text("dict")
-                for block in page_dict["blocks"]:
-                    if block["type"] == 0:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                font_sizes.append(span["size"])
-        
-        avg_font_size = sum(font_sizes) / max(len(font_sizes), 1) if font_sizes else 12
+        if avg_font_size is None:
+            avg_font_size = calculate_document_avg_font_size(doc) if doc else 12
+        
+        # Primer bloque de texto de la página (candidato a encabezado por posición)
+        first_text_block = next((b for b in blocks if b["type"] == 0), None)
         
         # Analizar bloques
         for block in blocks:
@@ -547,17 +641,12 @@ def analyze_text_style(page, doc=None) -> Dict:
                     heading_level = min(heading_level if heading_level > 0 else 5, 4)
                 
                 # Por posición - primer bloque de la página
-                page_blocks = [b for b in blocks if b["type"] == 0]
-                if page_blocks and page_blocks[0] == block and not is_heading:
+                if block is first_text_block and not is_heading:
                     is_heading = True
                     heading_level = min(heading_level if heading_level > 0 else 5, 1)
                 
                 # Detectar si es elemento de lista
-                is_list_item = False
-                for pattern in list_patterns:
-                    if re.match(pattern, block_text):
-                        is_list_item = True
-                        break
+                is_list_item = bool(_LIST_RE.match(block_text))
                 
                 # Clasificar bloque
                 block_info = {
@@ -681,7 +770,7 @@ def _detect_tables_from_lines(page) -> List[Dict]:
         return tables
     
     # Filtrar líneas muy cortas (pueden ser subrayados o adornos)
-    avg_line_length = sum(line["length"] for line in lines) / max(1, len(lines))
+    avg_line_length = fmean(line["length"] for line in lines)
     lines = [line for line in lines if line["length"] > avg_line_length * 0.3]
     
     # Identificar líneas horizontales y verticales
@@ -746,24 +835,47 @@ def _find_line_intersections(h_lines, v_lines, tolerance=2) -> List[Tuple[float,
     Returns:
         List[Tuple[float, float]]: Lista de puntos de intersección (x, y)
     """
-    intersections = []
+    if not h_lines or not v_lines:
+        return []
+    
+    # Líneas horizontales como (y, x_min, x_max) y verticales como (x, y_min, y_max)
+    h = np.array([(l["p1"][1], min(l["p1"][0], l["p2"][0]), max(l["p1"][0], l["p2"][0]))
+                  for l in h_lines], dtype=np.float64)
+    v = np.array([(l["p1"][0], min(l["p1"][1], l["p2"][1]), max(l["p1"][1], l["p2"][1]))
+                  for l in v_lines], dtype=np.float64)
+    
+    # Matriz (H, V) de cruces entre cada horizontal y cada vertical
+    h_y, h_x_min, h_x_max = h[:, 0:1], h[:, 1:2], h[:, 2:3]
+    v_x, v_y_min, v_y_max = v[:, 0], v[:, 1], v[:, 2]
+    crosses = ((h_x_min - tolerance <= v_x) & (v_x <= h_x_max + tolerance) &
+               (v_y_min - tolerance <= h_y) & (h_y <= v_y_max + tolerance))
+    
+    # np.nonzero recorre la matriz por filas: mismo orden que el doble bucle
+    h_idx, v_idx = np.nonzero(crosses)
+    return list(zip(v[v_idx, 0].tolist(), h[h_idx, 0].tolist()))
+
+
+def _nearest_sorted_index(sorted_values: List[float], targets: np.ndarray) -> np.ndarray:
+    """
+    Índice del valor más cercano a cada objetivo dentro de una lista ordenada
+    (en caso de empate, el menor), mediante búsqueda binaria.
     
-    for h in h_lines:
-        h_y = h["p1"][1]  # Coordenada Y de la línea horizontal
-        h_x_min = min(h["p1"][0], h["p2"][0])
-        h_x_max = max(h["p1"][0], h["p2"][0])
+    Args:
+        sorted_values: Valores ordenados de forma ascendente
+        targets: Valores a localizar
         
-        for v in v_lines:
-            v_x = v["p1"][0]  # Coordenada X de la línea vertical
-            v_y_min = min(v["p1"][1], v["p2"][1])
-            v_y_max = max(v["p1"][1], v["p2"][1])
-            
-            # Verificar si las líneas se cruzan
-            if (h_x_min - tolerance <= v_x <= h_x_max + tolerance and 
-                v_y_min - tolerance <= h_y <= v_y_max + tolerance):
-                intersections.append((v_x, h_y))
+    Returns:
+        np.ndarray: Índices en sorted_values
+    """
+    values = np.asarray(sorted_values, dtype=np.float64)
+    if len(values) == 1:
+        return np.zeros(len(targets), dtype=np.intp)
     
-    return intersections
+    # Candidatos: el vecino anterior y el posterior a la posición de inserción
+    upper = np.clip(np.searchsorted(values, targets), 1, len(values) - 1)
+    lower = upper - 1
+    closer_to_lower = np.abs(targets - values[lower]) <= np.abs(values[upper] - targets)
+    return np.where(closer_to_lower, lower, upper)
 
 
 def _group_intersections_into_grids(intersections, tolerance=5) -> List[Dict]:
@@ -793,16 +905,15 @@ def _group_intersections_into_grids(intersections, tolerance=5) -> List[Dict]:
         # Una buena tabla debe tener intersecciones en una gran parte de las celdas
         
         # Contar intersecciones para cada par (fila, columna)
-        cell_counts = defaultdict(int)
-        for x, y in intersections:
-            # Encontrar la fila y columna más cercanas
-            row_idx = min(range(len(rows)), key=lambda i: abs(rows[i] - y))
-            col_idx = min(range(len(cols)), key=lambda i: abs(cols[i] - x))
-            cell_counts[(row_idx, col_idx)] += 1
+        points = np.array(intersections, dtype=np.float64)
+        row_idx = _nearest_sorted_index(rows, points[:, 1])
+        col_idx = _nearest_sorted_index(cols, points[:, 0])
+        cell_counts = np.zeros((len(rows), len(cols)), dtype=np.int32)
+        np.add.at(cell_counts, (row_idx, col_idx), 1)
         
         # Calcular densidad: porcentaje de celdas con intersecciones
         total_cells = len(rows) * len(cols)
-        filled_cells = len(cell_counts)
+        filled_cells = int(np.count_nonzero(cell_counts))
         density = filled_cells / total_cells if total_cells > 0 else 0
         
         # Si la densidad es alta, es probablemente una tabla
@@ -831,7 +942,7 @@ def _detect_tables_from_text_alignment(page) -> List[Dict]:
     
     try:
         # Obtener bloques de texto
-        blocks = page.get_text("dict")["blocks"]
+        blocks = page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]
         text_blocks = [b for b in blocks if b["type"] == 0]
         
         if len(text_blocks) < 4:  # Pocas probabilidades de tabla
@@ -946,21 +1057,25 @@ def _is_table_duplicate(new_table, existing_tables, overlap_threshold=0.7) -> bo
         bool: True si la tabla es duplicada
     """
     new_rect = new_table["rect"]
+    new_area = (new_rect[2] - new_rect[0]) * (new_rect[3] - new_rect[1])
+    if new_area <= 0:
+        return False
     
     for table in existing_tables:
         old_rect = table["rect"]
         
-        # Calcular área de superposición
+        # Calcular área de superposición; sin solapamiento no puede ser duplicada
         x_overlap = max(0, min(new_rect[2], old_rect[2]) - max(new_rect[0], old_rect[0]))
+        if x_overlap == 0:
+            continue
         y_overlap = max(0, min(new_rect[3], old_rect[3]) - max(new_rect[1], old_rect[1]))
         overlap_area = x_overlap * y_overlap
         
-        # Calcular áreas
-        new_area = (new_rect[2] - new_rect[0]) * (new_rect[3] - new_rect[1])
+        # Calcular área de la tabla existente
         old_area = (old_rect[2] - old_rect[0]) * (old_rect[3] - old_rect[1])
         
         # Verificar superposición relativa
-        if new_area > 0 and old_area > 0:
+        if old_area > 0:
             relative_overlap = overlap_area / min(new_area, old_area)
             if relative_overlap > overlap_threshold:
                 return True
@@ -983,20 +1098,7 @@ def detect_lists(page) -> List[Dict]:
     
     try:
         # Obtener bloques de texto
-        blocks = page.get_text("dict")["blocks"]
-        
-        # Patrones para detectar elementos de lista
-        bullet_patterns = [
-            r'^\s*[•⦿⦾⦿○●◦▪▫]\s'  # Bullets
-        ]
-        
-        numbered_patterns = [
-            r'^\s*\d+\.\s',         # Números con punto
-            r'^\s*\(\d+\)\s',       # Números con paréntesis
-            r'^\s*[a-z]\)\s',       # Letras con paréntesis
-            r'^\s*[ivxlcdm]+\.\s',  # Números romanos en minúsculas
-            r'^\s*[IVXLCDM]+\.\s',  # Números romanos en mayúsculas
-        ]
+        blocks = page.get_text("dict", flags=_TEXT_DICT_FLAGS)["blocks"]
         
         # Buscar líneas consecutivas que podrían ser elementos de lista
         potential_list_items = []
@@ -1008,8 +1110,8 @@ def detect_lists(page) -> List[Dict]:
                     text = text.strip()
                     
                     # Verificar si coincide con algún patrón de lista
-                    is_bullet = any(re.match(pattern, text) for pattern in bullet_patterns)
-                    is_numbered = any(re.match(pattern, text) for pattern in numbered_patterns)
+                    is_bullet = bool(_BULLET_RE.match(text))
+                    is_numbered = bool(_NUMBERED_RE.match(text))
                     
                     if is_bullet or is_numbered:
                         item = {
@@ -1178,7 +1280,7 @@ def check_text_font_consistency(doc) -> Dict:
             page = doc[page_num]
             
             # Obtener texto en formato JSON
-            text_page = page.get_text("dict")
+            text_page = page.get_text("dict", flags=_TEXT_DICT_FLAGS)
             
             for block in text_page["blocks"]:
                 if block["type"] == 0:  # Bloque de texto
@@ -1235,7 +1337,7 @@ def check_text_font_consistency(doc) -> Dict:
         }
 
 
-def detect_headings(page, doc=None) -> List[Dict]:
+def detect_headings(page, doc=None, avg_font_size: Optional[float] = None) -> List[Dict]:
     """
     Detecta encabezados en una página basándose en formato visual.
     Relevante para checkpoints 14-001 a 14-007 de Matterhorn.
@@ -1243,13 +1345,14 @@ def detect_headings(page, doc=None) -> List[Dict]:
     Args:
         page (fitz.Page): Objeto página de PyMuPDF
         doc (fitz.Document): Documento completo (opcional)
+        avg_font_size: Tamaño medio de fuente del documento ya calculado (opcional)
         
     Returns:
         List[Dict]: Lista de encabezados detectados
     """
     try:
         # Usar analyze_text_style para extraer estilos y posible jerarquía
-        styles_info = analyze_text_style(page, doc)
+        styles_info = analyze_text_style(page, doc, avg_font_size)
         headings = styles_info.get("headings", [])
         
         # Ordenar encabezados por posición vertical